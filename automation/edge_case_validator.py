@@ -591,6 +591,10 @@ def main():
     print(f"Report: {results.get('report_path', 'N/A')}")
     print("=" * 60)
     
+    # Machine-readable last line so the master executor can find the report
+    if 'report_path' in results:
+        print(f"REPORT_PATH={os.path.abspath(results['report_path'])}")
+    
     # Exit with appropriate code
     exit_code = 0 if len(results['critical_issues']) == 0 else 1
     sys.exit(exit_code)
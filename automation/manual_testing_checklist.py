@@ -9,13 +9,13 @@ import json
 import webbrowser
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 class ManualTestingChecklistGenerator:
     """Generates comprehensive manual testing checklists"""
     
-    def __init__(self):
-        self.checklist_dir = Path("automation/manual_testing")
+    def __init__(self, checklist_dir: Optional[Path] = None):
+        self.checklist_dir = Path(checklist_dir) if checklist_dir else Path("automation/manual_testing")
         self.checklist_dir.mkdir(parents=True, exist_ok=True)
         
     def generate_comprehensive_checklist(self) -> str:
@@ -499,10 +499,14 @@ class ManualTestingChecklistGenerator:
         
         return str(json_path)
 
+def generate_checklist(automation_dir: Optional[Path] = None) -> str:
+    """Generate the checklist under automation_dir/manual_testing and return the HTML path"""
+    checklist_dir = Path(automation_dir) / "manual_testing" if automation_dir else None
+    return ManualTestingChecklistGenerator(checklist_dir).generate_comprehensive_checklist()
+
 def main():
     """Main function for checklist generation"""
-    generator = ManualTestingChecklistGenerator()
-    html_path = generator.generate_comprehensive_checklist()
+    html_path = generate_checklist()
     
     print(f"\n🎯 Manual Testing Checklist Ready!")
     print(f"📄 Open: {html_path}")
@@ -9,24 +9,234 @@ import sys
 import subprocess
 import json
 import time
+import html
+import string
 from datetime import datetime
 from pathlib import Path
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
-from typing import Dict, List, Any, Optional
-import requests
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Backend services probed by the QA runner, as (name, port) pairs
+SERVICES: tuple[tuple[str, int], ...] = (
+    ('auth', 8001),
+    ('core', 8002),
+    ('ml', 8003),
+    ('payment', 8004),
+)
+
+# Command-line tools required by the QA runner
+PREREQUISITE_TOOLS = ('flutter', 'python', 'git')
+
+# Only the tail of each subprocess log is kept in the results
+LOG_TAIL_BYTES = 8 * 1024
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None when it does not exist"""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+def _count_pngs(root: Path) -> int:
+    """Recursively count PNG files using cached scandir entries"""
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.png'):
+                    count += 1
+    return count
+
+# QA report layout, split into sections so the report can be streamed to disk
+_QA_REPORT_HEADER = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>QA Test Report - Auto Job Apply</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }
+        .header { background: linear-gradient(135deg, #6366F1, #8B5CF6); color: white; padding: 30px; border-radius: 8px; margin-bottom: 20px; }
+        .status-pass { color: #059669; font-weight: bold; }
+        .status-fail { color: #DC2626; font-weight: bold; }
+        .section { margin: 20px 0; padding: 20px; border: 1px solid #e5e7eb; border-radius: 8px; }
+        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }
+        .metric { background: #f8fafc; padding: 15px; border-radius: 8px; text-align: center; }
+        .checklist { background: #fef3c7; padding: 15px; border-radius: 8px; margin: 10px 0; }
+        .manual-test { background: #dbeafe; padding: 15px; border-radius: 8px; margin: 10px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🧪 QA Test Report - Auto Job Apply</h1>
+            <p>Generated: $generated</p>
+            <p>Branch: $branch</p>
+            <p>Test Type: $test_type</p>
+        </div>
+        
+        <div class="section">
+            <h2>📊 Test Summary</h2>
+            <div class="metrics">
+                <div class="metric">
+                    <h3>Overall Status</h3>
+                    <p class="status-$status">$status_upper</p>
+                </div>
+                <div class="metric">
+                    <h3>Screenshots Captured</h3>
+                    <p>$screenshots_captured</p>
+                </div>
+                <div class="metric">
+                    <h3>Test Users Created</h3>
+                    <p>$test_users_created</p>
+                </div>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>🔐 Test Users (For Manual Testing)</h2>
+            <div class="manual-test">
+                <h4>Test User Account:</h4>
+                <p>Email: $test_user_email</p>
+                <p>Password: $test_user_password</p>
+            </div>
+            <div class="manual-test">
+                <h4>Super User Account:</h4>
+                <p>Email: $super_user_email</p>
+                <p>Password: $super_user_password</p>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>📋 QA Manual Testing Checklist</h2>
+""")
+
+_QA_CHECKLISTS = (
+    """            <div class="checklist">
+                <h4>🔐 Authentication Testing:</h4>
+                <ul>
+                    <li>☐ Test Google OAuth login button</li>
+                    <li>☐ Test Microsoft OAuth login button</li>
+                    <li>☐ Test Apple OAuth login button (if available)</li>
+                    <li>☐ Test email/password login with test user</li>
+                    <li>☐ Test invalid credentials handling</li>
+                    <li>☐ Test network timeout scenarios</li>
+                </ul>
+            </div>
+""",
+    """            <div class="checklist">
+                <h4>🏠 Dashboard Testing:</h4>
+                <ul>
+                    <li>☐ Verify dashboard loads correctly</li>
+                    <li>☐ Test navigation drawer functionality</li>
+                    <li>☐ Check responsive design on different screen sizes</li>
+                    <li>☐ Validate all dashboard widgets display correctly</li>
+                    <li>☐ Test quick action buttons</li>
+                </ul>
+            </div>
+""",
+    """            <div class="checklist">
+                <h4>💼 Job Application Testing:</h4>
+                <ul>
+                    <li>☐ Test job search functionality</li>
+                    <li>☐ Test job application form submission</li>
+                    <li>☐ Test job application editing</li>
+                    <li>☐ Test job application deletion</li>
+                    <li>☐ Test bulk operations</li>
+                    <li>☐ Verify form validation</li>
+                </ul>
+            </div>
+""",
+    """            <div class="checklist">
+                <h4>📄 Resume Management Testing:</h4>
+                <ul>
+                    <li>☐ Test resume upload functionality</li>
+                    <li>☐ Test resume editing</li>
+                    <li>☐ Test AI optimization features</li>
+                    <li>☐ Verify file format support</li>
+                    <li>☐ Test resume preview</li>
+                </ul>
+            </div>
+""",
+    """            <div class="checklist">
+                <h4>⚙️ Settings Testing:</h4>
+                <ul>
+                    <li>☐ Test theme switching</li>
+                    <li>☐ Test notification preferences</li>
+                    <li>☐ Test account management</li>
+                    <li>☐ Test data export/import</li>
+                    <li>☐ Test privacy settings</li>
+                </ul>
+            </div>
+""",
+    """            <div class="checklist">
+                <h4>🔐 Logout Testing:</h4>
+                <ul>
+                    <li>☐ Test logout functionality</li>
+                    <li>☐ Verify session cleanup</li>
+                    <li>☐ Test automatic logout on timeout</li>
+                    <li>☐ Verify return to login screen</li>
+                </ul>
+            </div>
+""",
+)
+
+_QA_REPORT_FOOTER = """        </div>
+        
+        <div class="section">
+            <h2>📸 Screenshot Gallery</h2>
+            <p>Screenshots are automatically captured during automation tests.</p>
+            <p>Location: <code>automation/screenshots/</code></p>
+            <p>Baseline comparison results available in validation report.</p>
+        </div>
+        
+        <div class="section">
+            <h2>🔗 Quick Links</h2>
+            <ul>
+                <li><a href="http://localhost:3000" target="_blank">🌐 Flutter Web App</a></li>
+""" + "".join(
+    f'                <li><a href="http://localhost:{port}/docs" target="_blank">'
+    f'📚 {"ML" if service == "ml" else service.title()} API Docs</a></li>\n'
+    for service, port in SERVICES
+) + """            </ul>
+        </div>
+    </div>
+</body>
+</html>
+"""
 
 class QATestRunner:
     """QA-focused test runner with manual testing support"""
     
     def __init__(self):
-        self.project_root = Path(__file__).parent.parent
-        self.automation_dir = Path(__file__).parent
+        # Resolve once so every derived path is already absolute
+        self.automation_dir = Path(__file__).resolve().parent
+        self.project_root = self.automation_dir.parent
         self.reports_dir = self.automation_dir / "reports"
         self.screenshots_dir = self.automation_dir / "screenshots"
         
+        # Shared keep-alive session for service health probes, created on first use
+        self._http = None
+        
     def run_qa_automation(self, test_type: str = "full") -> Dict[str, Any]:
         """Run automation tests for QA team"""
+        # Fail fast on missing tools before spawning any process
+        if not self._check_prerequisites_fast():
+            return {
+                'start_time': datetime.now().isoformat(),
+                'test_type': test_type,
+                'status': 'failed',
+                'error': 'Prerequisites not met'
+            }
+        
         print("🧪 QA Automation Test Runner")
         print("=" * 50)
         print(f"Test Type: {test_type}")
@@ -54,18 +264,26 @@ class QATestRunner:
             test_users = self._create_test_users()
             results['test_users'] = test_users
             
-            # Step 3: Start services
-            print("\n🚀 Step 3: Starting Backend Services...")
-            services_started = self._start_backend_services()
+            # Step 3: Start services (None records "not needed" for this test type)
+            services_started = None
+            if test_type in ['full', 'backend', 'oauth']:
+                print("\n🚀 Step 3: Starting Backend Services...")
+                services_started = self._start_backend_services()
             results['services_started'] = services_started
             
             # Step 4: Run tests based on type
-            if test_type in ['full', 'flutter']:
+            if test_type == 'full':
+                print("\n📱 Steps 4-5: Running Flutter and Backend Tests in parallel...")
+                flutter_results, backend_results = self._run_flutter_and_backend_tests()
+                results['flutter_results'] = flutter_results
+                results['backend_results'] = backend_results
+            
+            if test_type == 'flutter':
                 print("\n📱 Step 4: Running Flutter Tests...")
                 flutter_results = self._run_flutter_tests()
                 results['flutter_results'] = flutter_results
             
-            if test_type in ['full', 'backend']:
+            if test_type == 'backend':
                 print("\n🐍 Step 5: Running Backend Tests...")
                 backend_results = self._run_backend_tests()
                 results['backend_results'] = backend_results
@@ -82,8 +300,9 @@ class QATestRunner:
             
             # Step 8: Generate QA report
             print("\n📊 Step 8: Generating QA Report...")
-            report_path = self._generate_qa_report(results)
+            report_path, json_report_path = self._generate_qa_report(results)
             results['report_path'] = report_path
+            results['json_report_path'] = json_report_path
             
             # Step 9: Open results for QA review
             print("\n👀 Step 9: Opening Results for Review...")
@@ -97,6 +316,10 @@ class QATestRunner:
             results['error'] = str(e)
             print(f"❌ Test execution failed: {e}")
         
+        # The JSON copy is written last so it carries the final status and end time
+        if 'json_report_path' in results:
+            self._write_qa_results_json(results)
+        
         return results
     
     def _get_current_branch(self) -> str:
@@ -105,38 +328,52 @@ class QATestRunner:
             result = subprocess.run(['git', 'branch', '--show-current'], 
                                   capture_output=True, text=True, cwd=self.project_root)
             return result.stdout.strip()
-        except:
+        except (subprocess.SubprocessError, OSError):
             return 'unknown'
     
+    def _check_prerequisites_fast(self) -> bool:
+        """Check that all prerequisite tools are on PATH without running them"""
+        import shutil
+        
+        for name in PREREQUISITE_TOOLS:
+            if shutil.which(name) is None:
+                print(f"❌ {name} not found on PATH")
+                return False
+        return True
+    
     def _check_prerequisites(self) -> bool:
         """Check if all prerequisites are available"""
-        prerequisites = [
-            ('flutter', ['flutter', '--version']),
-            ('python', ['python', '--version']),
-            ('git', ['git', '--version'])
-        ]
+        prerequisites = [(name, [name, '--version']) for name in PREREQUISITE_TOOLS]
         
-        for name, command in prerequisites:
-            try:
-                result = subprocess.run(command, capture_output=True, timeout=10)
-                if result.returncode == 0:
-                    print(f"✅ {name} is available")
-                else:
-                    print(f"❌ {name} not working properly")
-                    return False
-            except Exception as e:
-                print(f"❌ {name} not found: {e}")
-                return False
+        # Version probes are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(prerequisites)) as executor:
+            futures = {
+                executor.submit(subprocess.run, command, capture_output=True, timeout=10): name
+                for name, command in prerequisites
+            }
+            
+            all_available = True
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                    if result.returncode == 0:
+                        print(f"✅ {name} is available")
+                    else:
+                        print(f"❌ {name} not working properly")
+                        all_available = False
+                except Exception as e:
+                    print(f"❌ {name} not found: {e}")
+                    all_available = False
         
-        return True
+        return all_available
     
     def _create_test_users(self) -> Dict[str, str]:
         """Create random test users for this test run"""
-        import random
-        import string
+        import secrets
         
         timestamp = int(time.time())
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+        random_suffix = secrets.token_urlsafe(6).lower().replace('-', '').replace('_', '')[:6]
         
         test_users = {
             'test_user_email': f"qatest_{timestamp}_{random_suffix}@gmail.com",
@@ -147,8 +384,11 @@ class QATestRunner:
         
         # Save to file for test execution
         credentials_file = self.automation_dir / "test_credentials.json"
-        with open(credentials_file, 'w') as f:
-            json.dump(test_users, f, indent=2)
+        if orjson is not None:
+            credentials_file.write_bytes(orjson.dumps(test_users, option=orjson.OPT_INDENT_2))
+        else:
+            with open(credentials_file, 'w') as f:
+                json.dump(test_users, f, indent=2)
         
         print(f"🔐 Test users created:")
         print(f"   Test User: {test_users['test_user_email']}")
@@ -156,19 +396,29 @@ class QATestRunner:
         
         return test_users
     
+    def _get_http_session(self):
+        """Return the shared HTTP session, importing requests on first use"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._http = requests.Session()
+            self._http.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+        return self._http
+    
     def _start_backend_services(self) -> bool:
         """Start all backend services"""
-        services = ['auth', 'core', 'ml', 'payment']
-        ports = [8001, 8002, 8003, 8004]
+        from requests.exceptions import RequestException
         
-        for service, port in zip(services, ports):
+        http = self._get_http_session()
+        for service, port in SERVICES:
             try:
                 # Check if service is already running
-                response = requests.get(f"http://localhost:{port}/health", timeout=2)
+                response = http.get(f"http://localhost:{port}/health", timeout=2)
                 if response.status_code == 200:
                     print(f"✅ {service} service already running on port {port}")
                     continue
-            except:
+            except RequestException:
                 pass
             
             # Start the service
@@ -183,9 +433,9 @@ class QATestRunner:
         
         # Verify all services are running
         all_running = True
-        for service, port in zip(services, ports):
+        for service, port in SERVICES:
             try:
-                response = requests.get(f"http://localhost:{port}/health", timeout=5)
+                response = http.get(f"http://localhost:{port}/health", timeout=5)
                 if response.status_code == 200:
                     print(f"✅ {service} service is healthy")
                 else:
@@ -200,43 +450,7 @@ class QATestRunner:
     def _run_flutter_tests(self) -> Dict[str, Any]:
         """Run Flutter integration tests"""
         try:
-            # Copy test file to integration_test directory
-            frontend_dir = self.project_root / "frontend"
-            integration_test_dir = frontend_dir / "integration_test"
-            integration_test_dir.mkdir(exist_ok=True)
-            
-            test_source = self.automation_dir / "tests" / "comprehensive_user_flow_test.dart"
-            test_dest = integration_test_dir / "app_test.dart"
-            
-            if test_source.exists():
-                import shutil
-                shutil.copy2(test_source, test_dest)
-            
-            # Run Flutter integration tests
-            cmd = ['flutter', 'test', 'integration_test', '--verbose']
-            
-            result = subprocess.run(
-                cmd,
-                cwd=frontend_dir,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            # Count screenshots captured
-            screenshots_captured = 0
-            if self.screenshots_dir.exists():
-                for root, dirs, files in os.walk(self.screenshots_dir):
-                    screenshots_captured += len([f for f in files if f.endswith('.png')])
-            
-            return {
-                'status': 'passed' if result.returncode == 0 else 'failed',
-                'screenshots_captured': screenshots_captured,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode
-            }
-            
+            return self._collect_flutter_results(self._launch_flutter())
         except Exception as e:
             return {
                 'status': 'error',
@@ -246,31 +460,129 @@ class QATestRunner:
     def _run_backend_tests(self) -> Dict[str, Any]:
         """Run backend API tests"""
         try:
-            test_file = self.automation_dir / "tests" / "backend_automation_test.py"
-            
-            cmd = ['python', '-m', 'pytest', str(test_file), '-v', '--tb=short']
-            
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            return {
-                'status': 'passed' if result.returncode == 0 else 'failed',
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode
-            }
-            
+            return self._collect_backend_results(self._launch_backend())
         except Exception as e:
             return {
                 'status': 'error',
                 'error': str(e)
             }
     
+    def _run_flutter_and_backend_tests(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run Flutter and backend tests concurrently, as the suites are independent"""
+        launched = {}
+        results = {}
+        for name, launch in (('flutter', self._launch_flutter), ('backend', self._launch_backend)):
+            try:
+                launched[name] = launch()
+            except Exception as e:
+                results[name] = {'status': 'error', 'error': str(e)}
+        
+        for name, collect in (('flutter', self._collect_flutter_results), ('backend', self._collect_backend_results)):
+            if name in launched:
+                try:
+                    results[name] = collect(launched[name])
+                except Exception as e:
+                    results[name] = {'status': 'error', 'error': str(e)}
+        
+        return results['flutter'], results['backend']
+    
+    def _launch_flutter(self) -> Tuple[subprocess.Popen, Path, Path]:
+        """Prepare and start the Flutter integration tests"""
+        # Copy test file to integration_test directory
+        frontend_dir = self.project_root / "frontend"
+        integration_test_dir = frontend_dir / "integration_test"
+        integration_test_dir.mkdir(exist_ok=True)
+        
+        test_source = self.automation_dir / "tests" / "comprehensive_user_flow_test.dart"
+        test_dest = integration_test_dir / "app_test.dart"
+        
+        src_stat = _stat_or_none(test_source)
+        if src_stat is not None:
+            # copy2 preserves mtime, so an identical (mtime, size) means the copy is current
+            dst_stat = _stat_or_none(test_dest)
+            if dst_stat is None or (src_stat.st_mtime, src_stat.st_size) != (dst_stat.st_mtime, dst_stat.st_size):
+                import shutil
+                shutil.copy2(test_source, test_dest)
+        
+        # Run Flutter integration tests
+        cmd = ['flutter', 'test', 'integration_test', '--verbose']
+        
+        return self._launch_logged(cmd, frontend_dir, 'flutter')
+    
+    def _collect_flutter_results(self, launched: Tuple[subprocess.Popen, Path, Path]) -> Dict[str, Any]:
+        """Wait for the Flutter integration tests and summarize them"""
+        result = self._wait_logged(launched, timeout=300)
+        
+        # Count screenshots captured
+        try:
+            screenshots_captured = _count_pngs(self.screenshots_dir)
+        except FileNotFoundError:
+            screenshots_captured = 0
+        
+        return {
+            'status': 'passed' if result['return_code'] == 0 else 'failed',
+            'screenshots_captured': screenshots_captured,
+            **result
+        }
+    
+    def _launch_backend(self) -> Tuple[subprocess.Popen, Path, Path]:
+        """Start the backend API tests"""
+        test_file = self.automation_dir / "tests" / "backend_automation_test.py"
+        
+        cmd = ['python', '-m', 'pytest', str(test_file), '-v', '--tb=short']
+        
+        return self._launch_logged(cmd, self.project_root, 'backend')
+    
+    def _collect_backend_results(self, launched: Tuple[subprocess.Popen, Path, Path]) -> Dict[str, Any]:
+        """Wait for the backend API tests and summarize them"""
+        result = self._wait_logged(launched, timeout=120)
+        
+        return {
+            'status': 'passed' if result['return_code'] == 0 else 'failed',
+            **result
+        }
+    
+    def _run_logged(self, cmd: List[str], cwd: Path, log_name: str, timeout: int) -> Dict[str, Any]:
+        """Run a command with output streamed to log files, keeping only the tails"""
+        return self._wait_logged(self._launch_logged(cmd, cwd, log_name), timeout)
+    
+    def _launch_logged(self, cmd: List[str], cwd: Path, log_name: str) -> Tuple[subprocess.Popen, Path, Path]:
+        """Start a command with stdout/stderr redirected to log files"""
+        self.reports_dir.mkdir(exist_ok=True)
+        stdout_log = self.reports_dir / f"{log_name}_stdout.log"
+        stderr_log = self.reports_dir / f"{log_name}_stderr.log"
+        
+        # The child inherits its own copies of the descriptors, so ours can be closed right away
+        with open(stdout_log, 'wb') as out, open(stderr_log, 'wb') as err:
+            process = subprocess.Popen(cmd, cwd=cwd, stdout=out, stderr=err)
+        
+        return process, stdout_log, stderr_log
+    
+    def _wait_logged(self, launched: Tuple[subprocess.Popen, Path, Path], timeout: int) -> Dict[str, Any]:
+        """Wait for a command started by _launch_logged and read back its log tails"""
+        process, stdout_log, stderr_log = launched
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        
+        return {
+            'return_code': return_code,
+            'stdout': self._read_log_tail(stdout_log),
+            'stderr': self._read_log_tail(stderr_log),
+            'stdout_log': str(stdout_log),
+            'stderr_log': str(stderr_log)
+        }
+    
+    def _read_log_tail(self, log_path: Path) -> str:
+        """Read the last LOG_TAIL_BYTES of a log file"""
+        with open(log_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - LOG_TAIL_BYTES, 0))
+            return f.read().decode('utf-8', errors='replace')
+    
     def _test_oauth_flows(self) -> Dict[str, Any]:
         """Test OAuth authentication flows"""
         oauth_results = {
@@ -294,18 +606,13 @@ class QATestRunner:
             # Run screenshot validator
             validator_script = self.automation_dir / "screenshot_validator.py"
             
-            result = subprocess.run(
-                ['python', str(validator_script)],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=120
+            result = self._run_logged(
+                ['python', str(validator_script)], self.project_root, 'validation', timeout=120
             )
             
             return {
-                'status': 'passed' if result.returncode == 0 else 'failed',
-                'stdout': result.stdout,
-                'stderr': result.stderr
+                'status': 'passed' if result['return_code'] == 0 else 'failed',
+                **result
             }
             
         except Exception as e:
@@ -314,176 +621,55 @@ class QATestRunner:
                 'error': str(e)
             }
     
-    def _generate_qa_report(self, results: Dict[str, Any]) -> str:
-        """Generate QA-focused HTML report"""
-        report_path = self.reports_dir / f"qa_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    def _generate_qa_report(self, results: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate QA-focused HTML report and pick the path for its JSON results copy"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        report_path = self.reports_dir / f"qa_test_report_{timestamp}.html"
+        json_path = self.reports_dir / f"qa_test_results_{timestamp}.json"
         self.reports_dir.mkdir(exist_ok=True)
         
-        # Generate comprehensive QA report
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>QA Test Report - Auto Job Apply</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }}
-                .header {{ background: linear-gradient(135deg, #6366F1, #8B5CF6); color: white; padding: 30px; border-radius: 8px; margin-bottom: 20px; }}
-                .status-pass {{ color: #059669; font-weight: bold; }}
-                .status-fail {{ color: #DC2626; font-weight: bold; }}
-                .section {{ margin: 20px 0; padding: 20px; border: 1px solid #e5e7eb; border-radius: 8px; }}
-                .metrics {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }}
-                .metric {{ background: #f8fafc; padding: 15px; border-radius: 8px; text-align: center; }}
-                .checklist {{ background: #fef3c7; padding: 15px; border-radius: 8px; margin: 10px 0; }}
-                .manual-test {{ background: #dbeafe; padding: 15px; border-radius: 8px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🧪 QA Test Report - Auto Job Apply</h1>
-                    <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p>Branch: {results.get('branch', 'unknown')}</p>
-                    <p>Test Type: {results.get('test_type', 'full')}</p>
-                </div>
-                
-                <div class="section">
-                    <h2>📊 Test Summary</h2>
-                    <div class="metrics">
-                        <div class="metric">
-                            <h3>Overall Status</h3>
-                            <p class="status-{results.get('status', 'unknown')}">{results.get('status', 'unknown').upper()}</p>
-                        </div>
-                        <div class="metric">
-                            <h3>Screenshots Captured</h3>
-                            <p>{results.get('flutter_results', {}).get('screenshots_captured', 0)}</p>
-                        </div>
-                        <div class="metric">
-                            <h3>Test Users Created</h3>
-                            <p>{len(results.get('test_users', {}))}</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🔐 Test Users (For Manual Testing)</h2>
-                    <div class="manual-test">
-                        <h4>Test User Account:</h4>
-                        <p>Email: {results.get('test_users', {}).get('test_user_email', 'N/A')}</p>
-                        <p>Password: {results.get('test_users', {}).get('test_user_password', 'N/A')}</p>
-                    </div>
-                    <div class="manual-test">
-                        <h4>Super User Account:</h4>
-                        <p>Email: {results.get('test_users', {}).get('super_user_email', 'N/A')}</p>
-                        <p>Password: {results.get('test_users', {}).get('super_user_password', 'N/A')}</p>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>📋 QA Manual Testing Checklist</h2>
-                    <div class="checklist">
-                        <h4>🔐 Authentication Testing:</h4>
-                        <ul>
-                            <li>☐ Test Google OAuth login button</li>
-                            <li>☐ Test Microsoft OAuth login button</li>
-                            <li>☐ Test Apple OAuth login button (if available)</li>
-                            <li>☐ Test email/password login with test user</li>
-                            <li>☐ Test invalid credentials handling</li>
-                            <li>☐ Test network timeout scenarios</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="checklist">
-                        <h4>🏠 Dashboard Testing:</h4>
-                        <ul>
-                            <li>☐ Verify dashboard loads correctly</li>
-                            <li>☐ Test navigation drawer functionality</li>
-                            <li>☐ Check responsive design on different screen sizes</li>
-                            <li>☐ Validate all dashboard widgets display correctly</li>
-                            <li>☐ Test quick action buttons</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="checklist">
-                        <h4>💼 Job Application Testing:</h4>
-                        <ul>
-                            <li>☐ Test job search functionality</li>
-                            <li>☐ Test job application form submission</li>
-                            <li>☐ Test job application editing</li>
-                            <li>☐ Test job application deletion</li>
-                            <li>☐ Test bulk operations</li>
-                            <li>☐ Verify form validation</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="checklist">
-                        <h4>📄 Resume Management Testing:</h4>
-                        <ul>
-                            <li>☐ Test resume upload functionality</li>
-                            <li>☐ Test resume editing</li>
-                            <li>☐ Test AI optimization features</li>
-                            <li>☐ Verify file format support</li>
-                            <li>☐ Test resume preview</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="checklist">
-                        <h4>⚙️ Settings Testing:</h4>
-                        <ul>
-                            <li>☐ Test theme switching</li>
-                            <li>☐ Test notification preferences</li>
-                            <li>☐ Test account management</li>
-                            <li>☐ Test data export/import</li>
-                            <li>☐ Test privacy settings</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="checklist">
-                        <h4>🔐 Logout Testing:</h4>
-                        <ul>
-                            <li>☐ Test logout functionality</li>
-                            <li>☐ Verify session cleanup</li>
-                            <li>☐ Test automatic logout on timeout</li>
-                            <li>☐ Verify return to login screen</li>
-                        </ul>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>📸 Screenshot Gallery</h2>
-                    <p>Screenshots are automatically captured during automation tests.</p>
-                    <p>Location: <code>automation/screenshots/</code></p>
-                    <p>Baseline comparison results available in validation report.</p>
-                </div>
-                
-                <div class="section">
-                    <h2>🔗 Quick Links</h2>
-                    <ul>
-                        <li><a href="http://localhost:3000" target="_blank">🌐 Flutter Web App</a></li>
-                        <li><a href="http://localhost:8001/docs" target="_blank">📚 Auth API Docs</a></li>
-                        <li><a href="http://localhost:8002/docs" target="_blank">📚 Core API Docs</a></li>
-                        <li><a href="http://localhost:8003/docs" target="_blank">📚 ML API Docs</a></li>
-                        <li><a href="http://localhost:8004/docs" target="_blank">📚 Payment API Docs</a></li>
-                    </ul>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        test_users = results.get('test_users', {})
+        status = results.get('status', 'unknown')
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(report_path, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(_QA_REPORT_HEADER.substitute(
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                branch=html.escape(str(results.get('branch', 'unknown'))),
+                test_type=html.escape(str(results.get('test_type', 'full'))),
+                status=html.escape(status),
+                status_upper=html.escape(status.upper()),
+                screenshots_captured=results.get('flutter_results', {}).get('screenshots_captured', 0),
+                test_users_created=len(test_users),
+                test_user_email=html.escape(test_users.get('test_user_email', 'N/A')),
+                test_user_password=html.escape(test_users.get('test_user_password', 'N/A')),
+                super_user_email=html.escape(test_users.get('super_user_email', 'N/A')),
+                super_user_password=html.escape(test_users.get('super_user_password', 'N/A'))
+            ))
+            for checklist in _QA_CHECKLISTS:
+                f.write(checklist)
+            f.write(_QA_REPORT_FOOTER)
         
-        return str(report_path)
+        return str(report_path), str(json_path)
+    
+    def _write_qa_results_json(self, results: Dict[str, Any]):
+        """Write the finalised results to their machine-readable JSON copy"""
+        json_path = Path(results['json_report_path'])
+        if orjson is not None:
+            json_path.write_bytes(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, default=str)
     
     def _open_results_for_qa(self, report_path: str):
         """Open test results for QA team review"""
         try:
+            import webbrowser
+            
             # Open HTML report
-            webbrowser.open(f"file://{os.path.abspath(report_path)}")
+            webbrowser.open(Path(report_path).as_uri())
             
             # Open screenshots folder
-            screenshots_path = os.path.abspath(self.screenshots_dir)
+            screenshots_path = str(self.screenshots_dir)
             if os.name == 'nt':  # Windows
                 os.startfile(screenshots_path)
             else:  # Unix-like
@@ -496,6 +682,12 @@ class QATestRunner:
             print(f"📄 Manual paths:")
             print(f"   Report: {report_path}")
             print(f"   Screenshots: {self.screenshots_dir}")
+    
+    def cleanup(self):
+        """Release resources held by the runner"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
 def main():
     """Main function for QA test execution"""
@@ -511,10 +703,14 @@ def main():
     
     if args.create_users_only:
         test_users = runner._create_test_users()
+        runner.cleanup()
         print("🔐 Test users created successfully")
         sys.exit(0)
     
-    results = runner.run_qa_automation(args.test_type)
+    try:
+        results = runner.run_qa_automation(args.test_type)
+    finally:
+        runner.cleanup()
     
     # Print final summary
     print("\n" + "=" * 60)
@@ -522,6 +718,7 @@ def main():
     print("=" * 60)
     print(f"Status: {results['status'].upper()}")
     print(f"Report: {results.get('report_path', 'N/A')}")
+    print(f"Results JSON: {results.get('json_report_path', 'N/A')}")
     print(f"Screenshots: automation/screenshots/")
     print("=" * 60)
     
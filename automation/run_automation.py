@@ -6,29 +6,113 @@ Orchestrates Flutter integration tests, Python backend tests, and screenshot val
 
 import os
 import sys
+import asyncio
 import subprocess
+import io
 import json
 import time
+import sqlite3
+import contextlib
 from datetime import datetime
+from importlib.util import find_spec
 from typing import Dict, List
 import argparse
 import shutil
+from collections import deque
+
+import jinja2
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Lines of subprocess output kept in memory per stream; full output goes to a log file
+OUTPUT_TAIL_LINES = 500
+
+# Required pip packages and the module each one is imported as
+_REQUIRED_IMPORTS = (
+    ('pytest', 'pytest'),
+    ('pytest-xdist', 'xdist'),
+    ('requests', 'requests'),
+    ('psycopg2', 'psycopg2'),
+    ('opencv-python', 'cv2'),
+    ('pillow', 'PIL')
+)
+
+# Python packages each run mode depends on; only these are checked
+PREREQ_PACKAGES_BY_MODE = {
+    'full': tuple(package for package, _ in _REQUIRED_IMPORTS),
+    'flutter': (),
+    'backend': ('pytest', 'pytest-xdist', 'requests', 'psycopg2'),
+    'validation': ('opencv-python', 'pillow')
+}
+
+# Run modes that talk to the backend services
+SERVICE_MODES = ('full', 'backend')
+
+# Status codes accepted from a service health probe
+HEALTHY_STATUSES = (200, 204)
+
+# Seconds a successful prerequisite check stays valid, keyed by check kind
+PREREQ_CACHE_TTL = {
+    'flutter': 300,
+    'package': 600,
+    'service': 60
+}
+
+# HTML report template, compiled once at import
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+with open(os.path.join(_TEMPLATES_DIR, 'report.html.j2'), 'r', encoding='utf-8') as _template_file:
+    _REPORT_TEMPLATE = jinja2.Environment(autoescape=True).from_string(_template_file.read())
+
+def _iter_files(root: str, recursive: bool = True):
+    """Yield file DirEntry objects under root using an explicit stack instead of os.walk"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                else:
+                    yield entry
+
+def _count_files(root: str, suffix: str, recursive: bool = True) -> int:
+    """Count files under root whose name ends with suffix"""
+    return sum(1 for entry in _iter_files(root, recursive) if entry.name.endswith(suffix))
+
+def _count_lines(path: str) -> int:
+    """Count newline-terminated lines in a file, reading it in binary chunks"""
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
 
 class AutomationRunner:
     """Main class to orchestrate all automation tests"""
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, force_prereq: bool = False, in_process_pytest: bool = False):
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.automation_dir = os.path.join(self.project_root, "automation")
         self.config = self.load_config(config_path)
+        self.force_prereq = force_prereq
+        # Run backend tests via pytest.main in this interpreter instead of a subprocess
+        self.in_process_pytest = in_process_pytest
+        self.prereq_cache_path = os.path.join(self.automation_dir, '.prereq_cache.json')
+        # Screenshot validator, created on first use and reused across validation passes
+        self._validator = None
+        # Run history database, opened on first use
+        self.runs_db_path = os.path.join(self.automation_dir, 'reports', 'runs.sqlite')
+        self._runs_db = None
+        # Per-phase results are added by each phase as it runs
         self.results = {
-            'start_time': datetime.now().isoformat(),
-            'flutter_tests': {},
-            'backend_tests': {},
-            'screenshot_validation': {},
+            'start_time': self._now().isoformat(),
             'overall_status': 'running'
         }
     
+    def _now(self) -> datetime:
+        """Current time; callers take one reading and derive every string from it"""
+        return datetime.now()
+    
     def load_config(self, config_path: str = None) -> Dict:
         """Load automation configuration"""
         default_config = {
@@ -49,7 +133,11 @@ class AutomationRunner:
             'screenshot': {
                 'similarity_threshold': 0.95,
                 'auto_fix_enabled': True
-            }
+            },
+            # Optional endpoint reporting every service's health in one response
+            'health_aggregator_url': None,
+            # Number of recent HTML reports to keep on disk; None keeps them all
+            'keep_html_reports': None
         }
         
         if config_path and os.path.exists(config_path):
@@ -59,57 +147,234 @@ class AutomationRunner:
         
         return default_config
     
-    def check_prerequisites(self) -> bool:
-        """Check if all prerequisites are met"""
+    def check_prerequisites(self, mode: str = 'full') -> bool:
+        """Check if the prerequisites for the given run mode are met"""
         print("🔍 Checking prerequisites...")
         
-        # Check Flutter installation
+        cache = {} if self.force_prereq else self._load_prereq_cache()
         try:
-            result = subprocess.run(['flutter', '--version'], 
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                print("❌ Flutter not found or not working")
+            return self._run_prerequisite_checks(cache, mode)
+        finally:
+            self._save_prereq_cache(cache)
+    
+    def _run_prerequisite_checks(self, cache: Dict, mode: str) -> bool:
+        """Run each prerequisite check not already satisfied by a fresh cache entry"""
+        # Check Flutter installation
+        needs_flutter = mode in ('full', 'flutter')
+        if needs_flutter and self._prereq_cached(cache, 'flutter'):
+            print("✅ Flutter is available (cached)")
+        elif needs_flutter:
+            try:
+                result = subprocess.run(['flutter', '--version'], 
+                                      capture_output=True, text=True, timeout=30)
+                if result.returncode != 0:
+                    print("❌ Flutter not found or not working")
+                    return False
+                print("✅ Flutter is available")
+                self._record_prereq(cache, 'flutter')
+            except Exception as e:
+                print(f"❌ Flutter check failed: {e}")
                 return False
-            print("✅ Flutter is available")
-        except Exception as e:
-            print(f"❌ Flutter check failed: {e}")
-            return False
         
-        # Check Python dependencies
-        required_packages = ['pytest', 'requests', 'psycopg2', 'opencv-python', 'pillow']
-        for package in required_packages:
-            try:
-                __import__(package.replace('-', '_'))
+        # Check Python dependencies (located without importing them)
+        required_packages = PREREQ_PACKAGES_BY_MODE[mode]
+        for package, module in _REQUIRED_IMPORTS:
+            if package not in required_packages:
+                continue
+            if self._prereq_cached(cache, f'package:{package}'):
+                print(f"✅ {package} is available (cached)")
+                continue
+            if find_spec(module) is not None:
                 print(f"✅ {package} is available")
-            except ImportError:
+                self._record_prereq(cache, f'package:{package}')
+            else:
                 print(f"❌ {package} not found. Install with: pip install {package}")
                 return False
         
-        # Check if backend services are running
-        import requests
+        # Check if backend services are running (probed concurrently)
+        required_services = []
         for service_name, service_config in self.config['services'].items():
-            if service_config['required']:
-                try:
-                    url = f"http://localhost:{service_config['port']}/health"
-                    response = requests.get(url, timeout=5)
-                    if response.status_code == 200:
-                        print(f"✅ {service_name} service is running")
-                    else:
-                        print(f"⚠️  {service_name} service returned status {response.status_code}")
-                except Exception as e:
-                    print(f"❌ {service_name} service not accessible: {e}")
-                    if service_config['required']:
-                        return False
+            if not service_config['required'] or mode not in SERVICE_MODES:
+                continue
+            if self._prereq_cached(cache, f'service:{service_name}'):
+                print(f"✅ {service_name} service is running (cached)")
+            else:
+                required_services.append((service_name, service_config))
+        
+        health_results = asyncio.run(self._gather_health(required_services)) if required_services else []
+        
+        for (service_name, service_config), result in zip(required_services, health_results):
+            if isinstance(result, Exception):
+                print(f"❌ {service_name} service not accessible: {result}")
+                if service_config['required']:
+                    return False
+            elif result in HEALTHY_STATUSES:
+                print(f"✅ {service_name} service is running")
+                self._record_prereq(cache, f'service:{service_name}')
+            else:
+                print(f"⚠️  {service_name} service returned status {result}")
         
         return True
     
+    def _load_prereq_cache(self) -> Dict:
+        """Load previously successful prerequisite checks"""
+        try:
+            with open(self.prereq_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_prereq_cache(self, cache: Dict):
+        """Persist successful prerequisite checks for subsequent runs"""
+        try:
+            with open(self.prereq_cache_path, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"⚠️  Could not save prerequisite cache: {e}")
+    
+    def _prereq_cached(self, cache: Dict, check: str) -> bool:
+        """Return True if a check succeeded recently enough to be skipped"""
+        entry = cache.get(check)
+        if not entry or not entry.get('ok'):
+            return False
+        ttl = PREREQ_CACHE_TTL[check.split(':', 1)[0]]
+        return time.time() - entry.get('ts', 0) < ttl
+    
+    def _record_prereq(self, cache: Dict, check: str):
+        """Record a successful check in the cache"""
+        cache[check] = {'ts': time.time(), 'ok': True}
+    
+    async def _check_service(self, session, service_name: str, service_config: Dict) -> int:
+        """Probe a single service's health endpoint and return its status code"""
+        import aiohttp
+        
+        url = f"http://localhost:{service_config['port']}/health"
+        retries = self.config['backend']['retry_count']
+        for attempt in range(retries + 1):
+            try:
+                # The FastAPI health routes are GET-only, so HEAD would just return 405
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                    return response.status
+            except aiohttp.ClientConnectionError:
+                # Retries reuse the session's pooled keep-alive connections
+                if attempt == retries:
+                    raise
+                await asyncio.sleep(0.1 * (2 ** attempt))
+    
+    async def _gather_health(self, services: List) -> List:
+        """Probe all services concurrently over a single pooled client session"""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit=8, limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            aggregator_url = self.config.get('health_aggregator_url')
+            if aggregator_url:
+                return await self._check_aggregated_health(session, aggregator_url, services)
+            return await asyncio.gather(
+                *(self._check_service(session, name, config) for name, config in services),
+                return_exceptions=True
+            )
+    
+    async def _check_aggregated_health(self, session, aggregator_url: str, services: List) -> List:
+        """Fetch every service's health status in one request to the aggregator endpoint
+        
+        The endpoint is expected to return a JSON object mapping service names to
+        the HTTP status code of that service's health check.
+        """
+        import aiohttp
+        
+        try:
+            async with session.get(aggregator_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                response.raise_for_status()
+                statuses = await response.json()
+        except Exception as e:
+            return [e] * len(services)
+        
+        return [
+            statuses[name] if name in statuses else KeyError(f"{name} missing from aggregated health response")
+            for name, _ in services
+        ]
+    
+    def _log_path(self, log_name: str) -> str:
+        """Return a timestamped log file path under reports/"""
+        reports_dir = os.path.join(self.automation_dir, 'reports')
+        os.makedirs(reports_dir, exist_ok=True)
+        return os.path.join(reports_dir, f'{log_name}_{self._now().strftime("%Y%m%d_%H%M%S")}.log')
+    
+    def _run_pytest_in_process(self, args: List[str], log_name: str):
+        """Run pytest.main in this interpreter, capturing its output like _run_process
+        
+        sys.stdout/sys.stderr are redirected process-wide while pytest runs.
+        """
+        import pytest
+        
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            returncode = int(pytest.main(args))
+        
+        log_path = self._log_path(log_name)
+        with open(log_path, 'w', encoding='utf-8') as log_file:
+            log_file.write(stdout.getvalue())
+            log_file.write(stderr.getvalue())
+        
+        def tail(text: str) -> str:
+            return ''.join(deque(text.splitlines(keepends=True), maxlen=OUTPUT_TAIL_LINES))
+        
+        return returncode, tail(stdout.getvalue()), tail(stderr.getvalue()), log_path
+    
+    async def _run_process(self, cmd: List[str], cwd: str, timeout: float, log_name: str):
+        """Run a subprocess without blocking the event loop, killing it on timeout or error
+        
+        Output is drained line by line: the full log goes to reports/<log_name>_<timestamp>.log
+        and only the last OUTPUT_TAIL_LINES lines of each stream are kept in memory.
+        """
+        log_path = self._log_path(log_name)
+        stdout_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20
+        )
+        
+        with open(log_path, 'wb', buffering=1 << 20) as log_file:
+            async def drain(stream, tail):
+                async for line in stream:
+                    log_file.write(line)
+                    tail.append(line.decode(errors='replace'))
+            
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(drain(process.stdout, stdout_tail), drain(process.stderr, stderr_tail), process.wait()),
+                    timeout=timeout
+                )
+            except BaseException:
+                # Timeout, cancellation or a failed drain (e.g. a line over the stream limit)
+                if process.returncode is None:
+                    process.kill()
+                await process.wait()
+                raise
+        
+        return process.returncode, ''.join(stdout_tail), ''.join(stderr_tail), log_path
+    
     def run_flutter_tests(self) -> Dict:
+        """Run Flutter integration tests with screenshot capture"""
+        return asyncio.run(self.run_flutter_tests_async())
+    
+    def _run_flutter_tests_fast(self, skip_copy: bool = True) -> Dict:
+        """Re-run Flutter tests without re-syncing the test file or re-checking prerequisites"""
+        return asyncio.run(self.run_flutter_tests_async(skip_copy=skip_copy))
+    
+    async def run_flutter_tests_async(self, skip_copy: bool = False) -> Dict:
         """Run Flutter integration tests with screenshot capture"""
         print("\n🧪 Running Flutter Integration Tests...")
         
         flutter_result = {
             'status': 'running',
-            'start_time': datetime.now().isoformat(),
+            'start_time': self._now().isoformat(),
             'tests_run': 0,
             'tests_passed': 0,
             'tests_failed': 0,
@@ -129,45 +394,39 @@ class AutomationRunner:
             test_source = os.path.join(self.automation_dir, 'tests', 'flutter_integration_test.dart')
             test_dest = os.path.join(integration_test_dir, 'app_test.dart')
             
-            if os.path.exists(test_source):
-                shutil.copy2(test_source, test_dest)
+            if not skip_copy and os.path.exists(test_source):
+                self._sync_test_file(test_source, test_dest)
             
             # Run Flutter integration tests
             cmd = ['flutter', 'test', 'integration_test', '--verbose']
             
-            process = subprocess.Popen(
-                cmd,
-                cwd=frontend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            returncode, stdout, stderr, log_path = await self._run_process(
+                cmd, frontend_dir, self.config['flutter']['test_timeout'], 'flutter'
             )
             
-            stdout, stderr = process.communicate(timeout=self.config['flutter']['test_timeout'])
-            
             # Parse results
-            if process.returncode == 0:
+            if returncode == 0:
                 flutter_result['status'] = 'passed'
                 # Count screenshots
                 screenshots_dir = os.path.join(self.automation_dir, 'screenshots')
                 if os.path.exists(screenshots_dir):
-                    for root, dirs, files in os.walk(screenshots_dir):
-                        flutter_result['screenshots_captured'] += len([f for f in files if f.endswith('.png')])
+                    flutter_result['screenshots_captured'] = _count_files(screenshots_dir, '.png')
             else:
                 flutter_result['status'] = 'failed'
                 flutter_result['errors'].append(stderr)
             
-            flutter_result['stdout'] = stdout
-            flutter_result['stderr'] = stderr
+            flutter_result['stdout_tail'] = stdout
+            flutter_result['stderr_tail'] = stderr
+            flutter_result['log_path'] = log_path
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             flutter_result['status'] = 'timeout'
             flutter_result['errors'].append('Flutter tests timed out')
         except Exception as e:
             flutter_result['status'] = 'error'
             flutter_result['errors'].append(str(e))
         
-        flutter_result['end_time'] = datetime.now().isoformat()
+        flutter_result['end_time'] = self._now().isoformat()
         self.results['flutter_tests'] = flutter_result
         
         print(f"📱 Flutter tests: {flutter_result['status']}")
@@ -175,13 +434,43 @@ class AutomationRunner:
         
         return flutter_result
     
+    def _sync_test_file(self, test_source: str, test_dest: str):
+        """Copy the test file into place, leaving an up-to-date destination untouched
+        
+        copy2 keeps the source's mtime, which preserves Flutter's incremental build cache.
+        The destination is a real copy, not a hardlink, because other scripts overwrite it.
+        """
+        src_stat = os.stat(test_source)
+        try:
+            dst_stat = os.stat(test_dest)
+            if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+                # Break a hardlink left by an earlier run before writing through it
+                os.unlink(test_dest)
+            elif (src_stat.st_mtime_ns, src_stat.st_size) == (dst_stat.st_mtime_ns, dst_stat.st_size):
+                return
+        except FileNotFoundError:
+            pass
+        
+        shutil.copy2(test_source, test_dest)
+    
     def run_backend_tests(self) -> Dict:
         """Run Python backend tests"""
+        return asyncio.run(self.run_backend_tests_async())
+    
+    async def run_backend_tests_async(self, in_process: bool = None) -> Dict:
+        """Run Python backend tests
+        
+        Tests run in a separate interpreter unless in_process (defaulting to
+        self.in_process_pytest) is set, in which case pytest.main is called here.
+        The backend test_timeout cannot be enforced in-process.
+        """
         print("\n🐍 Running Backend Tests...")
+        if in_process is None:
+            in_process = self.in_process_pytest
         
         backend_result = {
             'status': 'running',
-            'start_time': datetime.now().isoformat(),
+            'start_time': self._now().isoformat(),
             'tests_run': 0,
             'tests_passed': 0,
             'tests_failed': 0,
@@ -193,42 +482,46 @@ class AutomationRunner:
             # Run pytest on backend tests
             test_file = os.path.join(self.automation_dir, 'tests', 'backend_automation_test.py')
             
-            cmd = ['python', '-m', 'pytest', test_file, '-v', '--tb=short', '--json-report', 
-                   '--json-report-file=automation/reports/backend_test_results.json']
+            report_file = os.path.join(self.automation_dir, 'reports', 'backend_test_results.json')
+            pytest_args = [test_file, '-v', '--tb=short', '--json-report', f'--json-report-file={report_file}']
             
-            process = subprocess.Popen(
-                cmd,
-                cwd=self.project_root,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            stdout, stderr = process.communicate(timeout=self.config['backend']['test_timeout'])
+            if in_process:
+                # A running pytest.main cannot be interrupted, so no timeout is applied here;
+                # xdist is disabled since its workers would be fresh interpreters anyway
+                returncode, stdout, stderr, log_path = await asyncio.to_thread(
+                    self._run_pytest_in_process, [*pytest_args, '-p', 'no:xdist'], 'backend'
+                )
+            else:
+                # Tests are spread across pytest-xdist workers
+                returncode, stdout, stderr, log_path = await self._run_process(
+                    ['python', '-m', 'pytest', *pytest_args, '-n', 'auto'], self.project_root,
+                    self.config['backend']['test_timeout'], 'backend'
+                )
             
             # Parse results
-            if process.returncode == 0:
+            if returncode == 0:
                 backend_result['status'] = 'passed'
             else:
                 backend_result['status'] = 'failed'
                 backend_result['errors'].append(stderr)
             
-            # Count API response screenshots
-            api_responses_dir = os.path.join(self.automation_dir, 'screenshots', 'api_responses')
-            if os.path.exists(api_responses_dir):
-                backend_result['api_responses_captured'] = len([f for f in os.listdir(api_responses_dir) if f.endswith('.json')])
+            # Count API response screenshots, one JSON line each
+            responses_file = os.path.join(self.automation_dir, 'screenshots', 'api_responses', 'responses.jsonl')
+            if os.path.exists(responses_file):
+                backend_result['api_responses_captured'] = _count_lines(responses_file)
             
-            backend_result['stdout'] = stdout
-            backend_result['stderr'] = stderr
+            backend_result['stdout_tail'] = stdout
+            backend_result['stderr_tail'] = stderr
+            backend_result['log_path'] = log_path
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             backend_result['status'] = 'timeout'
             backend_result['errors'].append('Backend tests timed out')
         except Exception as e:
             backend_result['status'] = 'error'
             backend_result['errors'].append(str(e))
         
-        backend_result['end_time'] = datetime.now().isoformat()
+        backend_result['end_time'] = self._now().isoformat()
         self.results['backend_tests'] = backend_result
         
         print(f"🔧 Backend tests: {backend_result['status']}")
@@ -236,13 +529,23 @@ class AutomationRunner:
         
         return backend_result
     
+    def _get_validator(self):
+        """Return the shared screenshot validator, importing it (and cv2) on first use"""
+        if self._validator is None:
+            if self.automation_dir not in sys.path:
+                sys.path.append(self.automation_dir)
+            from screenshot_validator import ScreenshotValidator
+            
+            self._validator = ScreenshotValidator()
+        return self._validator
+    
     def run_screenshot_validation(self) -> Dict:
         """Run screenshot validation and auto-fixing"""
         print("\n📸 Running Screenshot Validation...")
         
         validation_result = {
             'status': 'running',
-            'start_time': datetime.now().isoformat(),
+            'start_time': self._now().isoformat(),
             'total_screenshots': 0,
             'passed': 0,
             'failed': 0,
@@ -251,11 +554,7 @@ class AutomationRunner:
         }
         
         try:
-            # Import and run screenshot validator
-            sys.path.append(self.automation_dir)
-            from screenshot_validator import ScreenshotValidator
-            
-            validator = ScreenshotValidator()
+            validator = self._get_validator()
             
             # Run validation
             validation_report = validator.validate_all_screenshots()
@@ -277,7 +576,7 @@ class AutomationRunner:
                 # If fixes were applied, re-run Flutter tests to capture new screenshots
                 if fix_report['fixed'] > 0:
                     print("🔄 Re-running Flutter tests after fixes...")
-                    self.run_flutter_tests()
+                    self._run_flutter_tests_fast()
                     
                     # Re-validate screenshots
                     validation_report = validator.validate_all_screenshots()
@@ -294,7 +593,7 @@ class AutomationRunner:
             validation_result['status'] = 'error'
             validation_result['errors'].append(str(e))
         
-        validation_result['end_time'] = datetime.now().isoformat()
+        validation_result['end_time'] = self._now().isoformat()
         self.results['screenshot_validation'] = validation_result
         
         print(f"📊 Screenshot validation: {validation_result['status']}")
@@ -307,136 +606,114 @@ class AutomationRunner:
     
     def generate_final_report(self) -> str:
         """Generate comprehensive final report"""
-        self.results['end_time'] = datetime.now().isoformat()
+        now = self._now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        self.results['end_time'] = now.isoformat()
         
         # Determine overall status
         all_passed = (
-            self.results['flutter_tests'].get('status') == 'passed' and
-            self.results['backend_tests'].get('status') == 'passed' and
-            self.results['screenshot_validation'].get('status') == 'passed'
+            self.results.get('flutter_tests', {}).get('status') == 'passed' and
+            self.results.get('backend_tests', {}).get('status') == 'passed' and
+            self.results.get('screenshot_validation', {}).get('status') == 'passed'
         )
         
         self.results['overall_status'] = 'passed' if all_passed else 'failed'
         
-        # Save results to JSON
-        results_path = os.path.join(self.automation_dir, 'reports', f'automation_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
-        os.makedirs(os.path.dirname(results_path), exist_ok=True)
+        # Record the run in the history database
+        if orjson is not None:
+            results_json = orjson.dumps(self.results)
+        else:
+            results_json = json.dumps(self.results).encode('utf-8')
+        
+        db = self._get_runs_db()
+        with db:
+            cursor = db.execute(
+                'INSERT INTO runs (start_time, end_time, overall, results_json) VALUES (?, ?, ?, ?)',
+                (self.results['start_time'], self.results['end_time'], self.results['overall_status'], results_json)
+            )
         
-        with open(results_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        # Save results to JSON
+        results_path = os.path.join(self.automation_dir, 'reports', f'automation_results_{timestamp}.json')
+        with open(results_path, 'wb') as f:
+            f.write(results_json)
         
         # Generate HTML report
-        html_report = self.generate_html_report()
+        html_report = self.generate_html_report(timestamp)
+        if self.config.get('keep_html_reports') is not None:
+            self._remove_old_html_reports(self.config['keep_html_reports'])
         
         print(f"\n📄 Final report saved: {results_path}")
+        print(f"📄 Run #{cursor.lastrowid} recorded in: {self.runs_db_path}")
         print(f"📄 HTML report saved: {html_report}")
         
         return results_path
     
-    def generate_html_report(self) -> str:
-        """Generate HTML report"""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Auto Job Apply - Automation Test Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }}
-                .header {{ text-align: center; background: linear-gradient(135deg, #6366F1, #8B5CF6); color: white; padding: 30px; border-radius: 8px; margin-bottom: 20px; }}
-                .status-pass {{ color: #059669; font-weight: bold; }}
-                .status-fail {{ color: #DC2626; font-weight: bold; }}
-                .section {{ margin: 20px 0; padding: 20px; border: 1px solid #e5e7eb; border-radius: 8px; }}
-                .metrics {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-                .metric {{ background: #f8fafc; padding: 15px; border-radius: 8px; text-align: center; }}
-                .metric h3 {{ margin: 0 0 10px 0; color: #374151; }}
-                .metric p {{ margin: 0; font-size: 24px; font-weight: bold; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🤖 Auto Job Apply - Automation Test Report</h1>
-                    <p>Generated: {self.results.get('end_time', 'N/A')}</p>
-                    <p class="{'status-pass' if self.results['overall_status'] == 'passed' else 'status-fail'}">
-                        Overall Status: {self.results['overall_status'].upper()}
-                    </p>
-                </div>
-                
-                <div class="section">
-                    <h2>📱 Flutter Integration Tests</h2>
-                    <p class="{'status-pass' if self.results['flutter_tests'].get('status') == 'passed' else 'status-fail'}">
-                        Status: {self.results['flutter_tests'].get('status', 'N/A').upper()}
-                    </p>
-                    <div class="metrics">
-                        <div class="metric">
-                            <h3>Screenshots Captured</h3>
-                            <p>{self.results['flutter_tests'].get('screenshots_captured', 0)}</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🐍 Backend API Tests</h2>
-                    <p class="{'status-pass' if self.results['backend_tests'].get('status') == 'passed' else 'status-fail'}">
-                        Status: {self.results['backend_tests'].get('status', 'N/A').upper()}
-                    </p>
-                    <div class="metrics">
-                        <div class="metric">
-                            <h3>API Responses Captured</h3>
-                            <p>{self.results['backend_tests'].get('api_responses_captured', 0)}</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>📸 Screenshot Validation</h2>
-                    <p class="{'status-pass' if self.results['screenshot_validation'].get('status') == 'passed' else 'status-fail'}">
-                        Status: {self.results['screenshot_validation'].get('status', 'N/A').upper()}
-                    </p>
-                    <div class="metrics">
-                        <div class="metric">
-                            <h3>Total Screenshots</h3>
-                            <p>{self.results['screenshot_validation'].get('total_screenshots', 0)}</p>
-                        </div>
-                        <div class="metric">
-                            <h3>Passed</h3>
-                            <p>{self.results['screenshot_validation'].get('passed', 0)}</p>
-                        </div>
-                        <div class="metric">
-                            <h3>Failed</h3>
-                            <p>{self.results['screenshot_validation'].get('failed', 0)}</p>
-                        </div>
-                        <div class="metric">
-                            <h3>Auto-Fixed</h3>
-                            <p>{self.results['screenshot_validation'].get('auto_fixed', 0)}</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    def _get_runs_db(self) -> sqlite3.Connection:
+        """Open the run history database once per process, creating its schema if needed"""
+        if self._runs_db is None:
+            os.makedirs(os.path.dirname(self.runs_db_path), exist_ok=True)
+            self._runs_db = sqlite3.connect(self.runs_db_path)
+            with self._runs_db:
+                self._runs_db.execute(
+                    'CREATE TABLE IF NOT EXISTS runs ('
+                    'id INTEGER PRIMARY KEY, start_time TEXT, end_time TEXT, overall TEXT, results_json BLOB)'
+                )
+                self._runs_db.execute('CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs (start_time)')
+        return self._runs_db
+    
+    def list_runs(self, limit: int = 10) -> List[tuple]:
+        """Return the most recent runs as (id, start_time, end_time, overall) rows"""
+        return self._get_runs_db().execute(
+            'SELECT id, start_time, end_time, overall FROM runs ORDER BY id DESC LIMIT ?', (limit,)
+        ).fetchall()
+    
+    def _remove_old_html_reports(self, keep: int):
+        """Delete all but the newest `keep` HTML reports"""
+        reports_dir = os.path.join(self.automation_dir, 'reports')
+        with os.scandir(reports_dir) as entries:
+            # Timestamped names sort chronologically
+            reports = sorted(entry.path for entry in entries
+                             if entry.name.startswith('test_report_') and entry.name.endswith('.html'))
+        for path in reports[:max(len(reports) - keep, 0)]:
+            os.remove(path)
+    
+    def generate_html_report(self, timestamp: str = None) -> str:
+        """Generate HTML report, suffixed with the given timestamp"""
+        if timestamp is None:
+            timestamp = self._now().strftime("%Y%m%d_%H%M%S")
+        html_content = _REPORT_TEMPLATE.render(results=self.results)
         
-        report_path = os.path.join(self.automation_dir, 'reports', f'test_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.html')
+        report_path = os.path.join(self.automation_dir, 'reports', f'test_report_{timestamp}.html')
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         return report_path
     
-    def run_full_automation(self) -> bool:
-        """Run complete automation suite"""
+    async def _run_test_suites(self):
+        """Run the Flutter and backend test suites concurrently"""
+        # In-process pytest redirects stdout process-wide, so use a subprocess while overlapping
+        return await asyncio.gather(self.run_flutter_tests_async(), self.run_backend_tests_async(in_process=False))
+    
+    def run_full_automation(self, parallel: bool = False) -> bool:
+        """Run complete automation suite
+        
+        With parallel=True the Flutter and backend suites run concurrently.
+        """
         print("🚀 Starting Full Automation Suite...")
         print("=" * 60)
         
         # Check prerequisites
-        if not self.check_prerequisites():
+        if not self.check_prerequisites('full'):
             print("❌ Prerequisites not met. Aborting automation.")
             return False
         
-        # Run all test suites
-        flutter_result = self.run_flutter_tests()
-        backend_result = self.run_backend_tests()
+        # Flutter and backend suites are independent and may overlap; screenshot
+        # validation depends on the Flutter output and always runs afterwards
+        if parallel:
+            flutter_result, backend_result = asyncio.run(self._run_test_suites())
+        else:
+            flutter_result = self.run_flutter_tests()
+            backend_result = self.run_backend_tests()
         validation_result = self.run_screenshot_validation()
         
         # Generate final report
@@ -460,10 +737,30 @@ def main():
     parser.add_argument('--flutter-only', action='store_true', help='Run only Flutter tests')
     parser.add_argument('--backend-only', action='store_true', help='Run only backend tests')
     parser.add_argument('--validation-only', action='store_true', help='Run only screenshot validation')
+    parser.add_argument('--force-prereq', action='store_true', help='Ignore cached prerequisite checks')
+    parser.add_argument('--parallel', action='store_true', help='Run Flutter and backend tests concurrently')
+    parser.add_argument('--list-runs', type=int, nargs='?', const=10, metavar='N',
+                        help='List the last N recorded runs (default 10) and exit')
+    parser.add_argument('--dry-run', action='store_true', help='Only check prerequisites, then exit')
+    parser.add_argument('--in-process-pytest', action='store_true',
+                        help='Run backend tests serially via pytest.main in this process (the test timeout is not enforced)')
     
     args = parser.parse_args()
     
-    runner = AutomationRunner(args.config)
+    runner = AutomationRunner(args.config, force_prereq=args.force_prereq, in_process_pytest=args.in_process_pytest)
+    
+    if args.list_runs is not None:
+        for run_id, start_time, end_time, overall in runner.list_runs(args.list_runs):
+            print(f"#{run_id}  {start_time}  →  {end_time}  {overall.upper()}")
+        sys.exit(0)
+    
+    # Single-suite modes only check what that suite needs
+    mode = 'flutter' if args.flutter_only else 'backend' if args.backend_only else 'validation' if args.validation_only else None
+    if args.dry_run:
+        sys.exit(0 if runner.check_prerequisites(mode or 'full') else 1)
+    if mode and not runner.check_prerequisites(mode):
+        print("❌ Prerequisites not met. Aborting automation.")
+        sys.exit(1)
     
     if args.flutter_only:
         result = runner.run_flutter_tests()
@@ -475,7 +772,7 @@ def main():
         result = runner.run_screenshot_validation()
         success = result.get('status') == 'passed'
     else:
-        success = runner.run_full_automation()
+        success = runner.run_full_automation(parallel=args.parallel)
     
     sys.exit(0 if success else 1)
 
@@ -7,219 +7,76 @@ Orchestrates all testing components with comprehensive edge case validation
 import os
 import sys
 import json
-import subprocess
-import webbrowser
+import asyncio
+import secrets
+import multiprocessing
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
-import argparse
+from typing import Dict, List, Any, Optional, Tuple
 
-class MasterTestExecutor:
-    """Master orchestrator for all testing components"""
-    
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent
-        self.automation_dir = Path(__file__).parent
-        self.reports_dir = self.automation_dir / "reports"
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.execution_results = {
-            'execution_start': datetime.now().isoformat(),
-            'test_components': {},
-            'overall_status': 'running'
-        }
-    
-    def execute_comprehensive_testing(self, test_scope: str = "full") -> Dict[str, Any]:
-        """Execute comprehensive testing based on scope"""
-        print("🚀 MASTER TEST EXECUTION - AUTO JOB APPLY SYSTEM")
-        print("=" * 70)
-        print(f"Test Scope: {test_scope}")
-        print(f"Execution Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70)
-        
-        try:
-            # Component 1: Generate Manual Testing Checklist
-            if test_scope in ['full', 'manual', 'checklist']:
-                print("\n📋 Component 1: Generating Manual Testing Checklist...")
-                checklist_result = self._execute_manual_checklist()
-                self.execution_results['test_components']['manual_checklist'] = checklist_result
-            
-            # Component 2: Run Edge Case Validation
-            if test_scope in ['full', 'edge', 'validation']:
-                print("\n🔍 Component 2: Running Edge Case Validation...")
-                edge_case_result = self._execute_edge_case_validation()
-                self.execution_results['test_components']['edge_case_validation'] = edge_case_result
-            
-            # Component 3: Run OAuth Authentication Testing
-            if test_scope in ['full', 'oauth', 'auth']:
-                print("\n🔐 Component 3: Running OAuth Authentication Testing...")
-                oauth_result = self._execute_oauth_testing()
-                self.execution_results['test_components']['oauth_testing'] = oauth_result
-            
-            # Component 4: Run Visual Regression Testing
-            if test_scope in ['full', 'visual', 'screenshots']:
-                print("\n📸 Component 4: Running Visual Regression Testing...")
-                visual_result = self._execute_visual_regression()
-                self.execution_results['test_components']['visual_regression'] = visual_result
-            
-            # Component 5: Run Comprehensive Automation
-            if test_scope in ['full', 'automation', 'flutter']:
-                print("\n🤖 Component 5: Running Comprehensive Automation...")
-                automation_result = self._execute_comprehensive_automation()
-                self.execution_results['test_components']['comprehensive_automation'] = automation_result
-            
-            # Component 6: Generate Master Report
-            print("\n📊 Component 6: Generating Master Test Report...")
-            master_report = self._generate_master_test_report()
-            self.execution_results['master_report_path'] = master_report
-            
-            # Component 7: Open Results for Review
-            print("\n👀 Component 7: Opening Results for Review...")
-            self._open_all_results()
-            
-            self.execution_results['execution_end'] = datetime.now().isoformat()
-            self.execution_results['overall_status'] = self._determine_execution_status()
-            
-            print(f"\n✅ MASTER TEST EXECUTION COMPLETED!")
-            print(f"📄 Master Report: {master_report}")
-            
-        except Exception as e:
-            self.execution_results['execution_error'] = str(e)
-            self.execution_results['overall_status'] = 'error'
-            print(f"❌ Master test execution failed: {e}")
-        
-        return self.execution_results
-    
-    def _execute_manual_checklist(self) -> Dict[str, Any]:
-        """Execute manual testing checklist generation"""
-        try:
-            result = subprocess.run([
-                sys.executable, 
-                str(self.automation_dir / "manual_testing_checklist.py")
-            ], capture_output=True, text=True, timeout=60)
-            
-            return {
-                'component': 'manual_checklist',
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'error': result.stderr if result.returncode != 0 else None
-            }
-            
-        except Exception as e:
-            return {
-                'component': 'manual_checklist',
-                'status': 'error',
-                'error': str(e)
-            }
-    
-    def _execute_edge_case_validation(self) -> Dict[str, Any]:
-        """Execute edge case validation"""
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(self.automation_dir / "edge_case_validator.py")
-            ], capture_output=True, text=True, timeout=120)
-            
-            return {
-                'component': 'edge_case_validation',
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'error': result.stderr if result.returncode != 0 else None
-            }
-            
-        except Exception as e:
-            return {
-                'component': 'edge_case_validation',
-                'status': 'error',
-                'error': str(e)
-            }
-    
-    def _execute_oauth_testing(self) -> Dict[str, Any]:
-        """Execute OAuth authentication testing"""
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(self.automation_dir / "oauth_authentication_tester.py"),
-                "--provider", "all"
-            ], capture_output=True, text=True, timeout=120)
-            
-            return {
-                'component': 'oauth_testing',
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'error': result.stderr if result.returncode != 0 else None
-            }
-            
-        except Exception as e:
-            return {
-                'component': 'oauth_testing',
-                'status': 'error',
-                'error': str(e)
-            }
-    
-    def _execute_visual_regression(self) -> Dict[str, Any]:
-        """Execute visual regression testing"""
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(self.automation_dir / "visual_regression_tester.py")
-            ], capture_output=True, text=True, timeout=180)
-            
-            return {
-                'component': 'visual_regression',
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'error': result.stderr if result.returncode != 0 else None
-            }
-            
-        except Exception as e:
-            return {
-                'component': 'visual_regression',
-                'status': 'error',
-                'error': str(e)
-            }
-    
-    def _execute_comprehensive_automation(self) -> Dict[str, Any]:
-        """Execute comprehensive automation testing"""
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(self.automation_dir / "comprehensive_test_runner.py")
-            ], capture_output=True, text=True, timeout=300)
-            
-            return {
-                'component': 'comprehensive_automation',
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'error': result.stderr if result.returncode != 0 else None
-            }
-            
-        except Exception as e:
-            return {
-                'component': 'comprehensive_automation',
-                'status': 'error',
-                'error': str(e)
-            }
+# (name, banner, scopes, script, args, timeout) for each test component
+COMPONENTS = (
+    ('manual_checklist', '📋 Component 1: Generating Manual Testing Checklist',
+     ('full', 'manual', 'checklist'), 'manual_testing_checklist.py', [], 60),
+    ('edge_case_validation', '🔍 Component 2: Running Edge Case Validation',
+     ('full', 'edge', 'validation'), 'edge_case_validator.py', [], 120),
+    ('oauth_testing', '🔐 Component 3: Running OAuth Authentication Testing',
+     ('full', 'oauth', 'auth'), 'oauth_authentication_tester.py', ['--provider', 'all'], 120),
+    ('visual_regression', '📸 Component 4: Running Visual Regression Testing',
+     ('full', 'visual', 'screenshots'), 'visual_regression_tester.py', [], 180),
+    ('comprehensive_automation', '🤖 Component 5: Running Comprehensive Automation',
+     ('full', 'automation', 'flutter'), 'comprehensive_test_runner.py', [], 300),
+)
+
+# Characters of each component log read back for the report preview
+OUTPUT_PREVIEW_CHARS = 400
+
+# Bytes read from the end of a component log when looking for its REPORT_PATH= line
+LOG_TAIL_BYTES = 4096
+
+@dataclass(slots=True)
+class ComponentResult:
+    """Outcome of one test component"""
+    component: str
+    status: str
+    output: str = ''
+    output_len: int = 0
+    error: Optional[str] = None
+    log_path: Optional[str] = None
+    report_path: Optional[str] = None
+
+def _json_default(obj):
+    """Serialize component results for the JSON sidecar"""
+    if isinstance(obj, ComponentResult):
+        return asdict(obj)
+    return str(obj)
+
+# Port and shared auth key used by --daemon and --client
+DAEMON_PORT = 9876
+DAEMON_KEY_FILE = Path(__file__).resolve().parent / ".daemon_key"
+
+def _daemon_authkey(create: bool = False) -> bytes:
+    """Read the daemon auth key, or write a fresh one when starting a daemon"""
+    if not create:
+        return DAEMON_KEY_FILE.read_bytes()
     
-    def _determine_execution_status(self) -> str:
-        """Determine overall execution status"""
-        component_statuses = [
-            comp.get('status', 'unknown') 
-            for comp in self.execution_results['test_components'].values()
-        ]
-        
-        if all(status == 'success' for status in component_statuses):
-            return 'all_components_passed'
-        elif any(status == 'error' for status in component_statuses):
-            return 'execution_errors'
-        else:
-            return 'partial_success'
+    key = secrets.token_bytes(32)
+    fd = os.open(DAEMON_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+def _request_from_daemon(scope: str, port: int = DAEMON_PORT) -> Dict[str, Any]:
+    """Send a scope to a running daemon and wait for its execution results"""
+    from multiprocessing.connection import Client
     
-    def _generate_master_test_report(self) -> str:
-        """Generate master test execution report"""
-        report_path = self.reports_dir / f"master_test_execution_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        
-        html_content = f"""
+    with Client(('localhost', port), authkey=_daemon_authkey()) as conn:
+        conn.send(scope)
+        return conn.recv()
+
+# Master report layout; header and item are str.format templates
+_REPORT_HEADER = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -247,14 +104,14 @@ class MasterTestExecutor:
                 <div class="header">
                     <h1>🎯 Master Test Execution Report</h1>
                     <h2>Auto Job Apply System - Comprehensive Testing</h2>
-                    <p>Execution Time: {self.execution_results['execution_start']}</p>
-                    <p>Overall Status: <span class="status-{self._get_status_class()}">{self.execution_results.get('overall_status', 'unknown').upper()}</span></p>
+                    <p>Execution Time: {started}</p>
+                    <p>Overall Status: <span class="status-{status_class}">{status}</span></p>
                 </div>
                 
                 <div class="summary">
                     <div class="metric">
                         <h3>🧪 Test Components</h3>
-                        <h2>{len(self.execution_results['test_components'])}</h2>
+                        <h2>{n_components}</h2>
                         <p>Executed Successfully</p>
                     </div>
                     <div class="metric">
@@ -296,22 +153,18 @@ class MasterTestExecutor:
                 <div class="execution-timeline">
                     <h3>⏱️ Execution Timeline</h3>
         """
-        
-        # Add component execution results
-        for component_name, component_result in self.execution_results['test_components'].items():
-            status = component_result.get('status', 'unknown')
-            status_class = 'success' if status == 'success' else 'failed' if status == 'failed' else 'error'
-            
-            html_content += f"""
+
+_REPORT_ITEM = """
                     <div class="timeline-item">
-                        <h4>{component_name.replace('_', ' ').title()} 
-                            <span class="status-{status_class}">[{status.upper()}]</span>
+                        <h4>{name} 
+                            <span class="status-{status_class}">[{status}]</span>
                         </h4>
-                        <p>{component_result.get('output', 'Component executed')[:200]}...</p>
+                        <p>{output}...</p>
+                        {log_link}
                     </div>
             """
-        
-        html_content += """
+
+_REPORT_FOOTER = """
                 </div>
                 
                 <div class="component">
@@ -409,11 +262,238 @@ class MasterTestExecutor:
         </body>
         </html>
         """
+
+class MasterTestExecutor:
+    """Master orchestrator for all testing components"""
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or len(COMPONENTS)
+        self.project_root = Path(__file__).resolve().parent.parent
+        self.automation_dir = Path(__file__).resolve().parent
+        self.reports_dir = self.automation_dir / "reports"
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self.execution_results = {
+            'execution_start': datetime.now().isoformat(),
+            'test_components': {},
+            'overall_status': 'running'
+        }
+    
+    def execute_comprehensive_testing(self, test_scope: str = "full", open_results: bool = False) -> Dict[str, Any]:
+        """Execute comprehensive testing based on scope"""
+        started = datetime.now()
+        self.execution_results = {
+            'execution_start': started.isoformat(),
+            'test_components': {},
+            'overall_status': 'running'
+        }
         
-        return str(report_path)
+        print("🚀 MASTER TEST EXECUTION - AUTO JOB APPLY SYSTEM")
+        print("=" * 70)
+        print(f"Test Scope: {test_scope}")
+        print(f"Execution Time: {started.strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 70)
+        
+        try:
+            # Components 1-5 are independent, so run the selected ones concurrently
+            tasks = {}
+            for name, label, scopes, script_name, args, timeout in COMPONENTS:
+                if test_scope in scopes:
+                    print(f"\n{label}...")
+                    tasks[name] = (script_name, args, timeout)
+            
+            if tasks:
+                jobs = min(len(tasks), self.max_workers)
+                print(f"\n⚡ Running {len(tasks)} components using {jobs} parallel workers")
+                component_results = asyncio.run(self._run_components(tasks, jobs))
+                self.execution_results['test_components'].update(component_results)
+                
+                edge_case_result = component_results.get('edge_case_validation')
+                if edge_case_result and edge_case_result.report_path:
+                    self.execution_results['edge_case_report_path'] = edge_case_result.report_path
+            
+            self.execution_results['execution_end'] = datetime.now().isoformat()
+            self.execution_results['overall_status'] = self._determine_execution_status()
+            
+            # Component 6: Generate Master Report
+            print("\n📊 Component 6: Generating Master Test Report...")
+            master_report, master_report_json = self._generate_master_test_report()
+            self.execution_results['master_report_path'] = master_report
+            self.execution_results['master_report_json'] = master_report_json
+            
+            # Component 7: Open Results for Review
+            if open_results:
+                print("\n👀 Component 7: Opening Results for Review...")
+                self._open_all_results()
+            
+            print(f"\n✅ MASTER TEST EXECUTION COMPLETED!")
+            print(f"📄 Master Report: {master_report}")
+            print(f"📄 JSON Summary: {master_report_json}")
+            
+        except Exception as e:
+            self.execution_results['execution_error'] = str(e)
+            self.execution_results['overall_status'] = 'error'
+            print(f"❌ Master test execution failed: {e}")
+        
+        return self.execution_results
+    
+    def serve(self, port: int = DAEMON_PORT):
+        """Stay resident and run scope requests sent by --client invocations"""
+        from multiprocessing.connection import Listener
+        
+        with Listener(('localhost', port), authkey=_daemon_authkey(create=True)) as listener:
+            print(f"🔁 Master test daemon listening on localhost:{port} (Ctrl+C to stop)")
+            while True:
+                try:
+                    with listener.accept() as conn:
+                        scope = conn.recv()
+                        conn.send(self.execute_comprehensive_testing(scope))
+                except (EOFError, OSError, multiprocessing.AuthenticationError) as e:
+                    print(f"⚠️ Daemon request failed: {e}")
+    
+    async def _run_components(self, tasks: Dict[str, tuple], jobs: int) -> Dict[str, ComponentResult]:
+        """Run the selected component scripts concurrently, at most `jobs` at a time"""
+        slots = asyncio.Semaphore(jobs)
+        
+        async def run(name, task):
+            async with slots:
+                if name == 'manual_checklist':
+                    component_result = await asyncio.to_thread(self._run_manual_checklist)
+                else:
+                    component_result = await self._run_script(name, *task)
+            print(f"   {name}: {component_result.status}")
+            return name, component_result
+        
+        return dict(await asyncio.gather(*(run(name, task) for name, task in tasks.items())))
+    
+    def _run_manual_checklist(self) -> ComponentResult:
+        """Generate the manual testing checklist in-process; it is pure templating"""
+        try:
+            from manual_testing_checklist import generate_checklist
+            
+            html_path = generate_checklist(self.automation_dir)
+            return ComponentResult(
+                component='manual_checklist',
+                status='success',
+                output=f"Checklist generated: {html_path}",
+                report_path=html_path
+            )
+        except Exception as e:
+            return ComponentResult(component='manual_checklist', status='error', error=str(e))
+    
+    async def _run_script(self, name: str, script_name: str, args: List[str], timeout: int) -> ComponentResult:
+        """Run a component script, teeing its output to reports/<name>.log"""
+        log_path = self.reports_dir / f"{name}.log"
+        try:
+            try:
+                returncode = await self._run_subprocess(script_name, args, log_path, timeout)
+            except asyncio.TimeoutError:
+                return ComponentResult(
+                    component=name,
+                    status='error',
+                    error=f'Timed out after {timeout} seconds',
+                    log_path=str(log_path)
+                )
+            
+            with open(log_path, encoding='utf-8', errors='replace') as log_file:
+                output = log_file.read(OUTPUT_PREVIEW_CHARS)
+                output_len = os.fstat(log_file.fileno()).st_size
+            
+            return ComponentResult(
+                component=name,
+                status='success' if returncode == 0 else 'failed',
+                output=output,
+                output_len=output_len,
+                error=f'Exited with code {returncode}, see {log_path}' if returncode != 0 else None,
+                log_path=str(log_path),
+                report_path=self._parse_report_path(log_path)
+            )
+            
+        except Exception as e:
+            return ComponentResult(component=name, status='error', error=str(e))
+    
+    def _parse_report_path(self, log_path: Path) -> Optional[str]:
+        """Read the REPORT_PATH= line a component prints at the end of its log"""
+        with open(log_path, 'rb') as log_file:
+            log_file.seek(0, os.SEEK_END)
+            log_file.seek(max(0, log_file.tell() - LOG_TAIL_BYTES))
+            tail = log_file.read().decode(errors='replace')
+        
+        if 'REPORT_PATH=' not in tail:
+            return None
+        return tail.rsplit('REPORT_PATH=', 1)[-1].splitlines()[0].strip() or None
+    
+    async def _run_subprocess(self, script_name: str, args: List[str], log_path: Path, timeout: int) -> int:
+        """Run a script in a fresh interpreter and return its exit code"""
+        with open(log_path, 'wb') as log_file:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(self.automation_dir / script_name),
+                *args,
+                stdout=log_file,
+                stderr=asyncio.subprocess.STDOUT,
+                # Our own descriptors are non-inheritable (PEP 446), so there is nothing
+                # to close; leaving close_fds off lets CPython use posix_spawn on Linux
+                close_fds=False
+            )
+            try:
+                return await asyncio.wait_for(process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+    
+    def _determine_execution_status(self) -> str:
+        """Determine overall execution status"""
+        all_success = True
+        for comp in self.execution_results['test_components'].values():
+            status = comp.status
+            if status == 'error':
+                return 'execution_errors'
+            if status != 'success':
+                all_success = False
+        
+        return 'all_components_passed' if all_success else 'partial_success'
+    
+    def _generate_master_test_report(self) -> Tuple[str, str]:
+        """Generate master test execution report and its JSON sidecar"""
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        started = self.execution_results['execution_start']
+        report_path = self.reports_dir / f"master_test_execution_report_{stamp}.html"
+        
+        with open(report_path, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(_REPORT_HEADER.format(
+                started=started,
+                status_class=self._get_status_class(),
+                status=self.execution_results.get('overall_status', 'unknown').upper(),
+                n_components=len(self.execution_results['test_components'])
+            ))
+            
+            # Add component execution results
+            for component_name, component_result in self.execution_results['test_components'].items():
+                status = component_result.status
+                status_class = 'success' if status == 'success' else 'failed' if status == 'failed' else 'error'
+                log_link = ''
+                if component_result.log_path:
+                    log_link = (
+                        f'<p><a href="{Path(component_result.log_path).name}">Full log</a>'
+                        f' ({component_result.output_len:,} bytes)</p>'
+                    )
+                
+                f.write(_REPORT_ITEM.format(
+                    name=component_name.replace('_', ' ').title(),
+                    status_class=status_class,
+                    status=status.upper(),
+                    output=(component_result.output or 'Component executed')[:200],
+                    log_link=log_link
+                ))
+            
+            f.write(_REPORT_FOOTER)
+        
+        json_path = report_path.with_suffix('.json')
+        json_path.write_text(json.dumps(self.execution_results, indent=2, default=_json_default), encoding='utf-8')
+        
+        return str(report_path), str(json_path)
     
     def _get_status_class(self) -> str:
         """Get CSS class for overall status"""
@@ -425,24 +505,42 @@ class MasterTestExecutor:
         else:
             return 'failed'
     
+    def _latest_edge_case_report(self) -> Optional[Path]:
+        """Find the most recent edge case report in a single directory pass"""
+        latest, latest_mtime = None, -1.0
+        with os.scandir(self.reports_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('edge_case_validation_report_') and entry.name.endswith('.html'):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest, latest_mtime = entry.path, mtime
+        return Path(latest) if latest else None
+    
     def _open_all_results(self):
         """Open all test results for review"""
+        if sys.platform not in ('darwin', 'win32') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+            print("ℹ️  Headless environment detected; skipping auto-open")
+            return
+        
+        import webbrowser
+        
         try:
             # Open master report
             master_report = self.execution_results.get('master_report_path')
             if master_report:
-                webbrowser.open(f"file://{os.path.abspath(master_report)}")
+                webbrowser.open(Path(master_report).as_uri())
             
             # Open manual checklist
             checklist_path = self.automation_dir / "manual_testing" / "interactive_testing_checklist.html"
             if checklist_path.exists():
-                webbrowser.open(f"file://{os.path.abspath(checklist_path)}")
+                webbrowser.open(checklist_path.as_uri())
             
             # Open edge case report
-            edge_case_reports = list(self.reports_dir.glob("edge_case_validation_report_*.html"))
-            if edge_case_reports:
-                latest_edge_report = max(edge_case_reports, key=lambda p: p.stat().st_mtime)
-                webbrowser.open(f"file://{os.path.abspath(latest_edge_report)}")
+            # Prefer the report this run produced; fall back to the newest one on disk
+            edge_case_report = self.execution_results.get('edge_case_report_path')
+            latest_edge_report = Path(edge_case_report) if edge_case_report else self._latest_edge_case_report()
+            if latest_edge_report:
+                webbrowser.open(latest_edge_report.as_uri())
             
             print("👀 All test reports opened in browser")
             
@@ -451,6 +549,8 @@ class MasterTestExecutor:
 
 def main():
     """Main function for master test execution"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Master Test Execution System')
     parser.add_argument('--scope', 
                        choices=['full', 'manual', 'edge', 'oauth', 'visual', 'automation'], 
@@ -458,11 +558,39 @@ def main():
                        help='Scope of testing to execute')
     parser.add_argument('--open-results', action='store_true', 
                        help='Automatically open all test results')
+    parser.add_argument('--no-open', action='store_true',
+                       help='Never open results in a browser, even with --open-results')
+    parser.add_argument('--jobs', '-j', type=int,
+                       default=min(os.cpu_count() or 1, len(COMPONENTS)),
+                       help='Maximum number of components to run in parallel')
+    
+    parser.add_argument('--daemon', action='store_true',
+                       help='Stay resident and serve --client requests from a warm interpreter')
+    parser.add_argument('--client', action='store_true',
+                       help='Send --scope to a running daemon instead of executing locally')
+    parser.add_argument('--port', type=int, default=DAEMON_PORT,
+                       help='Port used by --daemon and --client')
     
     args = parser.parse_args()
     
-    executor = MasterTestExecutor()
-    results = executor.execute_comprehensive_testing(args.scope)
+    if args.client:
+        try:
+            results = _request_from_daemon(args.scope, args.port)
+        except (OSError, EOFError, multiprocessing.AuthenticationError) as e:
+            print(f"❌ Could not reach master test daemon on port {args.port}: {e}")
+            sys.exit(1)
+    else:
+        executor = MasterTestExecutor(max_workers=max(1, args.jobs))
+        if args.daemon:
+            try:
+                executor.serve(args.port)
+            except KeyboardInterrupt:
+                print("\n🛑 Master test daemon stopped")
+            return
+        
+        results = executor.execute_comprehensive_testing(
+            args.scope, open_results=args.open_results and not args.no_open
+        )
     
     # Print final execution summary
     print("\n" + "=" * 70)
@@ -7,11 +7,53 @@ Sets up the complete automation environment on local machine
 import os
 import sys
 import subprocess
+import socket
 import platform
 import json
+import time
+import shutil
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import Dict, List
 
+# Only this much of a buffered command's output is decoded and logged
+LOG_OUTPUT_BYTES = 4096
+
+# Only the last lines of a streamed command's output are kept for setup_log.txt
+STREAM_LOG_TAIL_LINES = 200
+
+# Successful tool probes are trusted for this long before being re-run
+SETUP_CACHE_TTL = 24 * 60 * 60
+
+# Run script templates written by create_run_scripts, filled in with str.format
+_BATCH_SCRIPT_TEMPLATE = """@echo off
+echo Starting Auto Job Apply Automation Suite...
+cd /d "{project_root}"
+call automation\\venv\\Scripts\\activate.bat
+python automation\\run_automation.py %*
+pause
+"""
+
+_SHELL_SCRIPT_TEMPLATE = """#!/bin/bash
+echo "Starting Auto Job Apply Automation Suite..."
+cd "{project_root}"
+source automation/venv/bin/activate
+python automation/run_automation.py "$@"
+"""
+
+_QUICK_SCRIPT_TEMPLATE = """#!/usr/bin/env python3
+import subprocess
+import sys
+import os
+
+os.chdir(r"{project_root}")
+result = subprocess.run({command}, shell=False)
+sys.exit(result.returncode)
+"""
+
 class LocalSetup:
     """Setup automation environment locally"""
     
@@ -20,33 +62,115 @@ class LocalSetup:
         self.automation_dir = self.project_root / "automation"
         self.system = platform.system().lower()
         self.setup_log = []
+        # Setup steps run on worker threads and all log through here
+        self._log_lock = threading.Lock()
+        # Results remembered between runs, e.g. detected tools
+        self.setup_cache_file = self.automation_dir / ".setup_cache.json"
+        self._cache_lock = threading.Lock()
         
-    def log(self, message: str, level: str = "INFO"):
-        """Log setup messages"""
+    def log(self, message: str, level: str = "INFO", record: bool = True):
+        """Log setup messages, keeping them for setup_log.txt unless record is False"""
         log_entry = f"[{level}] {message}"
-        print(log_entry)
-        self.setup_log.append(log_entry)
+        with self._log_lock:
+            print(log_entry)
+            if record:
+                self.setup_log.append(log_entry)
     
-    def run_command(self, command: List[str], cwd: Path = None, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a command and return the result"""
+    def run_command(self, command: List[str], cwd: Path = None, check: bool = True,
+                    text: bool = False, log_output: bool = True) -> subprocess.CompletedProcess:
+        """Run a command and return the result
+        
+        Output stays bytes unless text is set; only the first LOG_OUTPUT_BYTES are decoded for the log.
+        """
         try:
             self.log(f"Running: {' '.join(command)}")
             result = subprocess.run(
                 command, 
                 cwd=cwd or self.project_root,
                 capture_output=True,
-                text=True,
-                check=check
+                check=check,
+                **({'encoding': 'utf-8', 'errors': 'replace'} if text else {})
             )
-            if result.stdout:
-                self.log(f"Output: {result.stdout.strip()}")
+            if log_output and result.stdout:
+                self.log(f"Output: {self._decode_output(result.stdout)}")
             return result
         except subprocess.CalledProcessError as e:
             self.log(f"Command failed: {e}", "ERROR")
             if e.stderr:
-                self.log(f"Error: {e.stderr.strip()}", "ERROR")
+                self.log(f"Error: {self._decode_output(e.stderr)}", "ERROR")
             raise
     
+    def _decode_output(self, output) -> str:
+        """Leading part of a command's output as stripped text"""
+        if isinstance(output, bytes):
+            output = output[:LOG_OUTPUT_BYTES].decode('utf-8', 'replace')
+        return output.strip()
+    
+    def run_command_stream(self, command: List[str], cwd: Path = None, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a long command, printing its output line by line and recording only the tail"""
+        self.log(f"Running: {' '.join(command)}")
+        # Prefixed so lines from steps running side by side stay attributable
+        prefix = Path(command[0]).stem
+        with subprocess.Popen(
+            command,
+            cwd=cwd or self.project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        ) as process:
+            tail = deque(maxlen=STREAM_LOG_TAIL_LINES)
+            line_count = 0
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    self.log(f"{prefix}: {line}", record=False)
+                    tail.append(f"[INFO] {prefix}: {line}")
+                    line_count += 1
+        
+        with self._log_lock:
+            if line_count > len(tail):
+                self.setup_log.append(f"[INFO] {prefix}: ... {line_count - len(tail)} earlier lines omitted")
+            self.setup_log.extend(tail)
+        
+        if check and process.returncode != 0:
+            error = subprocess.CalledProcessError(process.returncode, command)
+            self.log(f"Command failed: {error}", "ERROR")
+            raise error
+        return subprocess.CompletedProcess(command, process.returncode)
+    
+    def _load_setup_cache(self) -> Dict:
+        """Read the setup cache, treating a missing or corrupt file as empty"""
+        try:
+            return json.loads(self.setup_cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def _update_setup_cache(self, **entries):
+        """Merge entries into the setup cache on disk"""
+        with self._cache_lock:
+            cache = self._load_setup_cache()
+            cache.update(entries)
+            try:
+                self.setup_cache_file.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+            except OSError as e:
+                self.log(f"Could not save setup cache: {e}", "WARNING")
+    
+    def _write_if_changed(self, path: Path, content: bytes) -> bool:
+        """Atomically replace path with content, leaving it untouched if identical; return True if written"""
+        try:
+            if path.read_bytes() == content:
+                return False
+        except FileNotFoundError:
+            pass
+        
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+        return True
+    
     def check_system_requirements(self) -> bool:
         """Check if system requirements are met"""
         self.log("🔍 Checking system requirements...")
@@ -61,18 +185,37 @@ class LocalSetup:
         
         missing_requirements = []
         
+        # A tool seen before at the same path and mtime is still there; a changed PATH voids everything
+        path_hash = hashlib.blake2b(os.environ.get('PATH', '').encode(), digest_size=8).hexdigest()
+        cache = self._load_setup_cache()
+        probes = cache.get('probes', {}) if cache.get('path_hash') == path_hash else {}
+        now = time.time()
+        
         for req_name, req_config in requirements.items():
+            executable = shutil.which(req_config['command'][0])
+            key = [executable, os.path.getmtime(executable)] if executable else None
+            cached = probes.get(req_name)
+            if key and cached and cached['key'] == key and now - cached['ts'] < SETUP_CACHE_TTL:
+                self.log(f"✅ {req_name} is available ({cached['version']}, cached)")
+                continue
+            
             try:
-                result = self.run_command(req_config['command'], check=False)
+                result = self.run_command(req_config['command'], check=False, text=True)
                 if result.returncode == 0:
                     self.log(f"✅ {req_name} is available")
+                    if key:
+                        probes[req_name] = {'key': key, 'ts': now, 'version': result.stdout.strip()[:200]}
                 else:
                     missing_requirements.append(req_name)
+                    probes.pop(req_name, None)
                     self.log(f"❌ {req_name} not found", "ERROR")
             except FileNotFoundError:
                 missing_requirements.append(req_name)
+                probes.pop(req_name, None)
                 self.log(f"❌ {req_name} not found", "ERROR")
         
+        self._update_setup_cache(path_hash=path_hash, probes=probes)
+        
         if missing_requirements:
             self.log("Missing requirements. Please install:", "ERROR")
             for req in missing_requirements:
@@ -103,7 +246,7 @@ class LocalSetup:
             # Install requirements
             requirements_file = self.automation_dir / "requirements.txt"
             if requirements_file.exists():
-                self.run_command([str(pip_executable), 'install', '-r', str(requirements_file)])
+                self.run_command_stream([str(pip_executable), 'install', '-r', str(requirements_file)])
                 self.log("✅ Python dependencies installed")
             
             return True
@@ -124,12 +267,12 @@ class LocalSetup:
             self.log("✅ Flutter web enabled")
             
             # Get dependencies
-            self.run_command(['flutter', 'pub', 'get'], cwd=frontend_dir)
+            self.run_command_stream(['flutter', 'pub', 'get'], cwd=frontend_dir)
             self.log("✅ Flutter dependencies installed")
             
             # Build runner for code generation
-            self.run_command(['flutter', 'packages', 'pub', 'run', 'build_runner', 'build'], 
-                           cwd=frontend_dir, check=False)
+            self.run_command_stream(['flutter', 'packages', 'pub', 'run', 'build_runner', 'build'], 
+                                    cwd=frontend_dir, check=False)
             self.log("✅ Code generation completed")
             
             return True
@@ -142,37 +285,50 @@ class LocalSetup:
         """Setup database for testing"""
         self.log("🗄️ Setting up database...")
         
+        host, port = 'localhost', 5432
+        
+        # A bare TCP connect shows whether the server is up without authenticating
         try:
-            # Check if PostgreSQL is running
-            import psycopg2
-            
+            socket.create_connection((host, port), timeout=1).close()
+        except OSError as e:
+            self.log(f"PostgreSQL is not reachable on {host}:{port}: {e}", "ERROR")
+            self.log("Please ensure PostgreSQL is running", "ERROR")
+            return False
+        
+        db_params = {'host': host, 'port': port, 'user': 'postgres', 'password': '9912129398', 'database': 'postgres'}
+        
+        # A login with the same connection parameters within SETUP_CACHE_TTL is trusted from the setup cache
+        params_hash = hashlib.blake2b(json.dumps(db_params, sort_keys=True).encode(), digest_size=8).hexdigest()
+        cached = self._load_setup_cache().get('postgres_probe')
+        if not (cached and cached['key'] == params_hash and time.time() - cached['ts'] < SETUP_CACHE_TTL):
             try:
-                conn = psycopg2.connect(
-                    host='localhost',
-                    port=5432,
-                    user='postgres',
-                    password='9912129398',
-                    database='postgres'
-                )
-                conn.close()
-                self.log("✅ PostgreSQL is accessible")
-                
-                # Create database tables
-                db_script = self.project_root / "create_database_tables.py"
-                if db_script.exists():
-                    self.run_command(['python', str(db_script)])
-                    self.log("✅ Database tables created")
-                
+                import psycopg2
+            except ImportError:
+                self.log("psycopg2 not available, will be installed with requirements", "WARNING")
                 return True
-                
+            
+            try:
+                psycopg2.connect(**db_params).close()
             except psycopg2.OperationalError as e:
                 self.log(f"PostgreSQL connection failed: {e}", "ERROR")
                 self.log("Please ensure PostgreSQL is running with correct credentials", "ERROR")
                 return False
-                
-        except ImportError:
-            self.log("psycopg2 not available, will be installed with requirements", "WARNING")
-            return True
+            self._update_setup_cache(postgres_probe={'key': params_hash, 'ts': time.time()})
+        
+        self.log("✅ PostgreSQL is accessible")
+        
+        # Create database tables
+        db_script = self.project_root / "create_database_tables.py"
+        if db_script.exists():
+            try:
+                self.run_command(['python', str(db_script)])
+            except subprocess.CalledProcessError:
+                # The cached login may be stale; verify it again next time
+                self._update_setup_cache(postgres_probe=None)
+                raise
+            self.log("✅ Database tables created")
+        
+        return True
     
     def create_automation_config(self) -> bool:
         """Create automation configuration file"""
@@ -218,59 +374,46 @@ class LocalSetup:
         self.log(f"✅ Configuration saved to {config_file}")
         return True
     
+    def _write_script(self, path: Path, body: str):
+        """Write an executable script, creating it with its mode in the same open call"""
+        data = body.replace('\n', os.linesep).encode('utf-8')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o755)
+        try:
+            os.write(fd, data)
+            if self.system != "windows":
+                # The creation mode does not apply to a script that already existed
+                os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
+    
     def create_run_scripts(self) -> bool:
         """Create convenient run scripts"""
         self.log("📝 Creating run scripts...")
         
         try:
-            # Create batch script for Windows
-            if self.system == "windows":
-                batch_script = self.project_root / "run_automation.bat"
-                with open(batch_script, 'w') as f:
-                    f.write(f"""@echo off
-echo Starting Auto Job Apply Automation Suite...
-cd /d "{self.project_root}"
-call automation\\venv\\Scripts\\activate.bat
-python automation\\run_automation.py %*
-pause
-""")
-                self.log("✅ Windows batch script created")
+            scripts = {}
             
-            # Create shell script for Unix-like systems
+            # Batch script for Windows, shell script for Unix-like systems
+            if self.system == "windows":
+                scripts[self.project_root / "run_automation.bat"] = _BATCH_SCRIPT_TEMPLATE.format(project_root=self.project_root)
             else:
-                shell_script = self.project_root / "run_automation.sh"
-                with open(shell_script, 'w') as f:
-                    f.write(f"""#!/bin/bash
-echo "Starting Auto Job Apply Automation Suite..."
-cd "{self.project_root}"
-source automation/venv/bin/activate
-python automation/run_automation.py "$@"
-""")
-                os.chmod(shell_script, 0o755)
-                self.log("✅ Shell script created")
+                scripts[self.project_root / "run_automation.sh"] = _SHELL_SCRIPT_TEMPLATE.format(project_root=self.project_root)
             
-            # Create quick test scripts
+            # Quick test scripts
             quick_scripts = {
                 'test_flutter.py': 'python automation/run_automation.py --flutter-only',
                 'test_backend.py': 'python automation/run_automation.py --backend-only',
                 'validate_screenshots.py': 'python automation/run_automation.py --validation-only'
             }
-            
             for script_name, command in quick_scripts.items():
-                script_path = self.automation_dir / script_name
-                with open(script_path, 'w') as f:
-                    f.write(f"""#!/usr/bin/env python3
-import subprocess
-import sys
-import os
-
-os.chdir(r"{self.project_root}")
-result = subprocess.run([{repr(command.split())}], shell=False)
-sys.exit(result.returncode)
-""")
-                if self.system != "windows":
-                    os.chmod(script_path, 0o755)
+                scripts[self.automation_dir / script_name] = _QUICK_SCRIPT_TEMPLATE.format(
+                    project_root=self.project_root, command=repr(command.split())
+                )
+            
+            for script_path, body in scripts.items():
+                self._write_script(script_path, body)
             
+            self.log("✅ Windows batch script created" if self.system == "windows" else "✅ Shell script created")
             self.log("✅ Quick test scripts created")
             return True
             
@@ -320,8 +463,8 @@ sys.exit(result.returncode)
                 ]
             }
             
-            with open(vscode_dir / "launch.json", 'w') as f:
-                json.dump(launch_config, f, indent=2)
+            # Unchanged files are not rewritten, so editors do not reload them
+            self._write_if_changed(vscode_dir / "launch.json", json.dumps(launch_config, indent=2).encode('utf-8'))
             
             # Tasks configuration
             tasks_config = {
@@ -350,8 +493,7 @@ sys.exit(result.returncode)
                 ]
             }
             
-            with open(vscode_dir / "tasks.json", 'w') as f:
-                json.dump(tasks_config, f, indent=2)
+            self._write_if_changed(vscode_dir / "tasks.json", json.dumps(tasks_config, indent=2).encode('utf-8'))
             
             self.log("✅ VS Code integration configured")
             return True
@@ -360,34 +502,50 @@ sys.exit(result.returncode)
             self.log(f"Failed to setup IDE integration: {e}", "ERROR")
             return False
     
+    def _run_step(self, step_name: str, step_function) -> bool:
+        """Run one setup step, logging its outcome"""
+        self.log(f"\n📋 {step_name}...")
+        try:
+            if step_function():
+                self.log(f"✅ {step_name} completed successfully")
+                return True
+            self.log(f"❌ {step_name} failed", "ERROR")
+        except Exception as e:
+            self.log(f"❌ {step_name} failed with exception: {e}", "ERROR")
+        return False
+    
     def run_setup(self) -> bool:
         """Run complete setup process"""
         self.log("🚀 Starting Auto Job Apply Automation Setup")
         self.log("=" * 60)
         
-        setup_steps = [
-            ("System Requirements", self.check_system_requirements),
-            ("Python Environment", self.setup_python_environment),
-            ("Flutter Environment", self.setup_flutter_environment),
-            ("Database Setup", self.setup_database),
-            ("Automation Config", self.create_automation_config),
-            ("Run Scripts", self.create_run_scripts),
-            ("IDE Integration", self.setup_ide_integration)
-        ]
+        # Each step maps to (function, steps it waits for); independent steps run concurrently
+        setup_steps = {
+            "System Requirements": (self.check_system_requirements, ()),
+            "Python Environment": (self.setup_python_environment, ()),
+            "Flutter Environment": (self.setup_flutter_environment, ()),
+            "Database Setup": (self.setup_database, ()),
+            "Automation Config": (self.create_automation_config, ("System Requirements",)),
+            "Run Scripts": (self.create_run_scripts, ("System Requirements",)),
+            "IDE Integration": (self.setup_ide_integration, ("System Requirements",))
+        }
         
-        failed_steps = []
+        results = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            running = {}
+            waiting = dict(setup_steps)
+            while waiting or running:
+                # Start every step whose predecessors have finished
+                for step_name, (step_function, depends_on) in list(waiting.items()):
+                    if all(dep in results for dep in depends_on):
+                        del waiting[step_name]
+                        running[executor.submit(self._run_step, step_name, step_function)] = step_name
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
         
-        for step_name, step_function in setup_steps:
-            self.log(f"\n📋 {step_name}...")
-            try:
-                if step_function():
-                    self.log(f"✅ {step_name} completed successfully")
-                else:
-                    self.log(f"❌ {step_name} failed", "ERROR")
-                    failed_steps.append(step_name)
-            except Exception as e:
-                self.log(f"❌ {step_name} failed with exception: {e}", "ERROR")
-                failed_steps.append(step_name)
+        failed_steps = [step_name for step_name in setup_steps if not results[step_name]]
         
         # Save setup log
         log_file = self.automation_dir / "setup_log.txt"
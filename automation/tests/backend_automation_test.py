@@ -8,13 +8,22 @@ import pytest
 import requests
 import json
 import time
-import psycopg2
+from psycopg2.extras import execute_values
 import asyncio
 import aiohttp
+import numpy as np
 from datetime import datetime
 from typing import Dict, List, Any
 import os
 import sys
+import queue
+import atexit
+import threading
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -36,36 +45,113 @@ class BackendTestConfig:
         'database': 'AutoJobApply'
     }
     SCREENSHOT_DIR = "automation/screenshots/api_responses"
+    # Every captured response is appended here as one JSON line
+    RESPONSES_FILE = os.path.join(SCREENSHOT_DIR, "responses.jsonl")
     TIMEOUT = 10
 
+# Full base URL per service, built once; class-body comprehensions cannot see BASE_URL
+BackendTestConfig.SERVICE_URLS = {
+    service: f"{BackendTestConfig.BASE_URL}:{port}" for service, port in BackendTestConfig.SERVICES.items()
+}
+
+class AsyncScreenshotWriter:
+    """Appends API responses to one JSON Lines file on a background thread
+    
+    Each record goes out in a single unbuffered O_APPEND write, so lines from
+    several processes sharing the file never interleave.
+    """
+    
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._queue = queue.Queue()
+        self._thread = None
+        self._fd = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, line: bytes):
+        """Queue an already-serialized response line for writing"""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name='screenshot-writer', daemon=True)
+                self._thread.start()
+        self._queue.put(line)
+    
+    def flush(self):
+        """Block until every queued response has been written"""
+        self._queue.join()
+    
+    def _drain(self):
+        """Write queued lines in arrival order through a single append-only descriptor"""
+        while True:
+            line = self._queue.get()
+            try:
+                if self._fd is None:
+                    os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+                    self._fd = os.open(self.filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                    atexit.register(os.close, self._fd)
+                os.write(self._fd, line)
+            except OSError as e:
+                print(f"⚠️  Could not save API response to {self.filepath}: {e}")
+            finally:
+                self._queue.task_done()
+
+# Flushed at the end of the pytest session by conftest.py
+SCREENSHOT_WRITER = AsyncScreenshotWriter(BackendTestConfig.RESPONSES_FILE)
+
 class APITestHelper:
     """Helper class for API testing and screenshot capture"""
     
     @staticmethod
     def save_response_screenshot(response_data: Dict, endpoint: str, test_name: str):
-        """Save API response as JSON screenshot"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{endpoint}_{test_name}_{timestamp}.json"
-        
-        # Create directory if it doesn't exist
-        os.makedirs(BackendTestConfig.SCREENSHOT_DIR, exist_ok=True)
-        
-        filepath = os.path.join(BackendTestConfig.SCREENSHOT_DIR, filename)
-        with open(filepath, 'w') as f:
-            json.dump(response_data, f, indent=2, default=str)
+        """Append API response to the JSON Lines screenshot file"""
+        record = {
+            'endpoint': endpoint,
+            'test': test_name,
+            'ts': time.time_ns(),
+            'data': response_data
+        }
+        # Serialized now, so later changes to response_data cannot leak into the file
+        if orjson is not None:
+            line = orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = json.dumps(record, default=str).encode('utf-8') + b'\n'
+        SCREENSHOT_WRITER.submit(line)
         
-        print(f"📸 API Response saved: {filepath}")
-        return filepath
+        print(f"📸 API Response saved: {endpoint}/{test_name} -> {BackendTestConfig.RESPONSES_FILE}")
+        return BackendTestConfig.RESPONSES_FILE
     
     @staticmethod
     def get_service_url(service: str) -> str:
         """Get full URL for a service"""
-        port = BackendTestConfig.SERVICES.get(service)
-        if not port:
-            raise ValueError(f"Unknown service: {service}")
-        return f"{BackendTestConfig.BASE_URL}:{port}"
+        try:
+            return BackendTestConfig.SERVICE_URLS[service]
+        except KeyError:
+            raise ValueError(f"Unknown service: {service}") from None
+
+class ServiceTestBase:
+    """Base for service test classes, sharing the pooled HTTP session"""
+    
+    @pytest.fixture(autouse=True)
+    def _use_http_session(self, http_session):
+        """Expose the session-wide requests.Session as self.session"""
+        self.session = http_session
+
+class TestServiceHealth(ServiceTestBase):
+    """Health checks for every backend service"""
+    
+    @pytest.mark.parametrize('service', list(BackendTestConfig.SERVICES))
+    def test_health_endpoint(self, service: str):
+        """Test a service's health endpoint"""
+        response = self.session.get(f"{APITestHelper.get_service_url(service)}/health", timeout=BackendTestConfig.TIMEOUT)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data.get('status') == 'healthy'
+        
+        # Save response screenshot
+        APITestHelper.save_response_screenshot(data, f'{service}_health', 'success')
 
-class TestAuthService:
+class TestAuthService(ServiceTestBase):
     """Test cases for Authentication Service"""
     
     def setup_method(self):
@@ -78,20 +164,9 @@ class TestAuthService:
             'last_name': 'Test'
         }
     
-    def test_health_endpoint(self):
-        """Test auth service health endpoint"""
-        response = requests.get(f"{self.base_url}/health", timeout=BackendTestConfig.TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data.get('status') == 'healthy'
-        
-        # Save response screenshot
-        APITestHelper.save_response_screenshot(data, 'auth_health', 'success')
-    
     def test_user_registration(self):
         """Test user registration endpoint"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/register",
             json=self.test_user,
             timeout=BackendTestConfig.TIMEOUT
@@ -113,7 +188,7 @@ class TestAuthService:
             'password': self.test_user['password']
         }
         
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/login",
             json=login_data,
             timeout=BackendTestConfig.TIMEOUT
@@ -127,26 +202,16 @@ class TestAuthService:
             error_data = {'status_code': response.status_code, 'error': response.text}
             APITestHelper.save_response_screenshot(error_data, 'auth_login', 'error')
 
-class TestCoreService:
+class TestCoreService(ServiceTestBase):
     """Test cases for Core Service"""
     
     def setup_method(self):
         """Setup for each test method"""
         self.base_url = APITestHelper.get_service_url('core')
     
-    def test_health_endpoint(self):
-        """Test core service health endpoint"""
-        response = requests.get(f"{self.base_url}/health", timeout=BackendTestConfig.TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data.get('status') == 'healthy'
-        
-        APITestHelper.save_response_screenshot(data, 'core_health', 'success')
-    
     def test_jobs_endpoint(self):
         """Test jobs listing endpoint"""
-        response = requests.get(f"{self.base_url}/jobs", timeout=BackendTestConfig.TIMEOUT)
+        response = self.session.get(f"{self.base_url}/jobs", timeout=BackendTestConfig.TIMEOUT)
         
         # Save response regardless of status
         if response.status_code == 200:
@@ -156,30 +221,20 @@ class TestCoreService:
             error_data = {'status_code': response.status_code, 'error': response.text}
             APITestHelper.save_response_screenshot(error_data, 'core_jobs', 'error')
 
-class TestMLService:
+class TestMLService(ServiceTestBase):
     """Test cases for ML Service"""
     
     def setup_method(self):
         """Setup for each test method"""
         self.base_url = APITestHelper.get_service_url('ml')
     
-    def test_health_endpoint(self):
-        """Test ML service health endpoint"""
-        response = requests.get(f"{self.base_url}/health", timeout=BackendTestConfig.TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data.get('status') == 'healthy'
-        
-        APITestHelper.save_response_screenshot(data, 'ml_health', 'success')
-    
     def test_resume_analysis(self):
         """Test resume analysis endpoint"""
         test_resume = {
             'resume_text': 'John Doe\nSoftware Engineer\n5 years experience in Python, JavaScript, React'
         }
         
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/analyze-resume",
             json=test_resume,
             timeout=BackendTestConfig.TIMEOUT
@@ -192,26 +247,16 @@ class TestMLService:
             error_data = {'status_code': response.status_code, 'error': response.text}
             APITestHelper.save_response_screenshot(error_data, 'ml_resume_analysis', 'error')
 
-class TestPaymentService:
+class TestPaymentService(ServiceTestBase):
     """Test cases for Payment Service"""
     
     def setup_method(self):
         """Setup for each test method"""
         self.base_url = APITestHelper.get_service_url('payment')
     
-    def test_health_endpoint(self):
-        """Test payment service health endpoint"""
-        response = requests.get(f"{self.base_url}/health", timeout=BackendTestConfig.TIMEOUT)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data.get('status') == 'healthy'
-        
-        APITestHelper.save_response_screenshot(data, 'payment_health', 'success')
-    
     def test_subscriptions_endpoint(self):
         """Test subscriptions endpoint"""
-        response = requests.get(f"{self.base_url}/subscriptions", timeout=BackendTestConfig.TIMEOUT)
+        response = self.session.get(f"{self.base_url}/subscriptions", timeout=BackendTestConfig.TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -223,17 +268,13 @@ class TestPaymentService:
 class TestDatabaseOperations:
     """Test database operations and data integrity"""
     
-    def setup_method(self):
-        """Setup database connection"""
-        self.conn = psycopg2.connect(**BackendTestConfig.DATABASE_CONFIG)
-        self.cursor = self.conn.cursor()
-    
-    def teardown_method(self):
-        """Cleanup database connection"""
-        if hasattr(self, 'cursor'):
-            self.cursor.close()
-        if hasattr(self, 'conn'):
-            self.conn.close()
+    @pytest.fixture(autouse=True)
+    def _use_pg_conn(self, pg_conn):
+        """Borrow a pooled database connection for this test"""
+        self.conn = pg_conn
+        self.cursor = pg_conn.cursor()
+        yield
+        self.cursor.close()
     
     def test_database_connection(self):
         """Test database connectivity"""
@@ -251,33 +292,41 @@ class TestDatabaseOperations:
     
     def test_user_table_operations(self):
         """Test user table CRUD operations"""
-        # Test insert
-        test_user_data = {
-            'email': 'db_test@automation.com',
-            'password_hash': 'hashed_password_123',
-            'first_name': 'DB',
-            'last_name': 'Test',
-            'is_active': True
-        }
+        # Test insert; rows are upserted in one multi-row statement per page
+        test_users = [
+            {
+                'email': 'db_test@automation.com',
+                'password_hash': 'hashed_password_123',
+                'first_name': 'DB',
+                'last_name': 'Test',
+                'is_active': True
+            }
+        ]
+        rows = [
+            (user['email'], user['password_hash'], user['first_name'], user['last_name'], user['is_active'])
+            for user in test_users
+        ]
         
         try:
-            self.cursor.execute("""
+            # fetch=True collects RETURNING rows from every page, not just the last
+            results = execute_values(self.cursor, """
                 INSERT INTO users (email, password_hash, first_name, last_name, is_active)
-                VALUES (%(email)s, %(password_hash)s, %(first_name)s, %(last_name)s, %(is_active)s)
+                VALUES %s
                 ON CONFLICT (email) DO UPDATE SET
                     first_name = EXCLUDED.first_name,
                     last_name = EXCLUDED.last_name
                 RETURNING id, email, created_at;
-            """, test_user_data)
+            """, rows, template="(%s, %s, %s, %s, %s)", page_size=500, fetch=True)
             
-            result = self.cursor.fetchone()
-            self.conn.commit()
+            # Not committed: pg_conn rolls the test's changes back afterwards
+            result = results[0]
             
             db_result = {
                 'operation': 'user_insert',
                 'user_id': result[0],
                 'email': result[1],
                 'created_at': result[2].isoformat(),
+                'rows_upserted': len(results),
                 'status': 'success'
             }
             
@@ -295,51 +344,72 @@ class TestDatabaseOperations:
 class TestPerformanceMetrics:
     """Test system performance and response times"""
     
-    def test_service_response_times(self):
-        """Test response times for all services"""
-        performance_data = {}
+    async def _probe_health(self, session: aiohttp.ClientSession, service_name: str) -> tuple:
+        """Time one service's health endpoint"""
+        loop = asyncio.get_running_loop()
+        url = f"{APITestHelper.get_service_url(service_name)}/health"
         
-        for service_name, port in BackendTestConfig.SERVICES.items():
-            url = f"{BackendTestConfig.BASE_URL}:{port}/health"
-            
-            start_time = time.time()
-            try:
-                response = requests.get(url, timeout=BackendTestConfig.TIMEOUT)
-                end_time = time.time()
-                
-                response_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        start_time = loop.time()
+        try:
+            async with session.get(url) as response:
+                await response.read()
+                response_time = (loop.time() - start_time) * 1000  # Convert to milliseconds
                 
-                performance_data[service_name] = {
+                return service_name, {
                     'response_time_ms': round(response_time, 2),
-                    'status_code': response.status_code,
-                    'status': 'success' if response.status_code == 200 else 'error'
-                }
-                
-            except Exception as e:
-                performance_data[service_name] = {
-                    'response_time_ms': None,
-                    'status_code': None,
-                    'status': 'failed',
-                    'error': str(e)
+                    'status_code': response.status,
+                    'status': 'success' if response.status == 200 else 'error'
                 }
         
+        except Exception as e:
+            return service_name, {
+                'response_time_ms': None,
+                'status_code': None,
+                'status': 'failed',
+                'error': str(e)
+            }
+    
+    async def _probe_all_services(self) -> Dict:
+        """Probe every service concurrently over one pooled session"""
+        timeout = aiohttp.ClientTimeout(total=BackendTestConfig.TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(*(
+                self._probe_health(session, service_name)
+                for service_name in BackendTestConfig.SERVICES
+            ))
+        return dict(results)
+    
+    def test_service_response_times(self):
+        """Test response times for all services"""
+        performance_data = asyncio.run(self._probe_all_services())
+        
+        # Response times and status codes as parallel arrays, in SERVICES order; NaN/0 where a probe failed
+        services = list(BackendTestConfig.SERVICES)
+        times = np.full(len(services), np.nan)
+        codes = np.zeros(len(services), dtype='i4')
+        for i, service_name in enumerate(services):
+            metrics = performance_data[service_name]
+            if metrics['status_code'] is not None:
+                times[i] = metrics['response_time_ms']
+                codes[i] = metrics['status_code']
+        ok = codes == 200
+        
         # Add overall metrics
-        successful_services = [s for s in performance_data.values() if s['status'] == 'success']
-        if successful_services:
-            avg_response_time = sum(s['response_time_ms'] for s in successful_services) / len(successful_services)
+        if ok.any():
             performance_data['overall_metrics'] = {
-                'average_response_time_ms': round(avg_response_time, 2),
-                'successful_services': len(successful_services),
-                'total_services': len(BackendTestConfig.SERVICES),
-                'success_rate': round(len(successful_services) / len(BackendTestConfig.SERVICES) * 100, 2)
+                'average_response_time_ms': round(float(times[ok].mean()), 2),
+                'successful_services': int(ok.sum()),
+                'total_services': len(services),
+                'success_rate': round(float(ok.mean()) * 100, 2)
             }
         
         APITestHelper.save_response_screenshot(performance_data, 'performance_metrics', 'complete')
         
         # Assert performance criteria
-        for service_name, metrics in performance_data.items():
-            if service_name != 'overall_metrics' and metrics['status'] == 'success':
-                assert metrics['response_time_ms'] < 5000, f"{service_name} response time too slow: {metrics['response_time_ms']}ms"
+        slow = ok & (times >= 5000)
+        assert not slow.any(), "response time too slow: " + ", ".join(
+            f"{services[i]} {times[i]}ms" for i in np.flatnonzero(slow)
+        )
 
 if __name__ == "__main__":
     # Run tests with pytest
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the backend automation tests
+"""
+
+import sys
+import asyncio
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+import aiohttp
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+# Backend services live in backend/<name>/, each with a test_server.py entry point and optionally its own venv
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+# Seconds to wait for launched services to report healthy
+SERVICE_STARTUP_TIMEOUT = 60
+
+# Delay between readiness probe rounds
+SERVICE_POLL_INTERVAL = 0.05
+
+# Service processes launched for this run, kept on the controller's config
+_STARTED_SERVICES = pytest.StashKey[list]()
+
+def _service_python(service_dir: Path) -> str:
+    """Interpreter from the service's own venv, falling back to the current one"""
+    for candidate in (service_dir / "venv" / "bin" / "python", service_dir / "venv" / "Scripts" / "python.exe"):
+        if candidate.exists():
+            return str(candidate)
+    return sys.executable
+
+def pytest_addoption(parser):
+    """Register the opt-in flag for launching backend services"""
+    parser.addoption('--start-services', action='store_true', default=False,
+                     help='Start backend services that are not already running before the tests')
+
+async def _wait_for_services(ports: Dict[int, Optional[subprocess.Popen]], timeout: float) -> set:
+    """Probe every port's /health together until all are up; return the ports that never came up
+    
+    A port whose launched process has already exited is given up on immediately.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pending = set(ports)
+    exited = set()
+    
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=1)) as session:
+        async def probe(port: int) -> bool:
+            try:
+                async with session.get(f"http://localhost:{port}/health") as response:
+                    return response.status == 200
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return False
+        
+        while True:
+            checked = sorted(pending)
+            results = await asyncio.gather(*(probe(port) for port in checked))
+            pending -= {port for port, healthy in zip(checked, results) if healthy}
+            
+            # A launched process that has exited will never answer
+            exited |= {port for port in pending if ports[port] is not None and ports[port].poll() is not None}
+            pending -= exited
+            if not pending or loop.time() >= deadline:
+                return pending | exited
+            await asyncio.sleep(SERVICE_POLL_INTERVAL)
+
+@pytest.fixture(scope='session')
+def http_session():
+    """One pooled HTTP session for every API test, reusing keep-alive connections"""
+    with requests.Session() as session:
+        session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        yield session
+
+@pytest.fixture(scope='session', autouse=True)
+def flush_response_screenshots():
+    """Make sure queued API response files are written before the session ends"""
+    from backend_automation_test import SCREENSHOT_WRITER
+    
+    yield
+    SCREENSHOT_WRITER.flush()
+
+@pytest.fixture(scope='session')
+def pg_pool():
+    """PostgreSQL connection pool opened once for the whole session"""
+    from psycopg2.pool import ThreadedConnectionPool
+    from backend_automation_test import BackendTestConfig
+    
+    pool = ThreadedConnectionPool(1, 4, **BackendTestConfig.DATABASE_CONFIG)
+    yield pool
+    pool.closeall()
+
+@pytest.fixture
+def pg_conn(pg_pool):
+    """A pooled connection whose changes are rolled back after the test"""
+    conn = pg_pool.getconn()
+    try:
+        yield conn
+    finally:
+        try:
+            conn.rollback()
+        finally:
+            # A connection that died mid-test is discarded instead of returned to the pool
+            pg_pool.putconn(conn, close=bool(conn.closed))
+
+def _start_services() -> list:
+    """Start any backend service that is not already running, then wait for all of them at once"""
+    from backend_automation_test import BackendTestConfig
+    
+    ports = {port: None for port in BackendTestConfig.SERVICES.values()}
+    down = asyncio.run(_wait_for_services(ports, timeout=0))
+    
+    processes = []
+    log_dir = BACKEND_DIR.parent / "automation" / "reports"
+    for service_name, port in BackendTestConfig.SERVICES.items():
+        service_dir = BACKEND_DIR / service_name
+        if port not in down or not (service_dir / "test_server.py").exists():
+            continue
+        
+        log_dir.mkdir(parents=True, exist_ok=True)
+        with open(log_dir / f"service_{service_name}.log", 'wb') as log_file:
+            # Same entry point as the docs and CI; each test_server.py binds its service's port
+            process = subprocess.Popen(
+                [_service_python(service_dir), 'test_server.py'],
+                cwd=service_dir, stdout=log_file, stderr=subprocess.STDOUT
+            )
+        ports[port] = process
+        processes.append(process)
+    
+    if processes:
+        launched = {port: process for port, process in ports.items() if process is not None}
+        for port in sorted(asyncio.run(_wait_for_services(launched, SERVICE_STARTUP_TIMEOUT))):
+            # Left to the health tests to report; other tests may not need this service
+            print(f"⚠️  Service on port {port} did not become healthy")
+    
+    return processes
+
+def pytest_configure(config):
+    """With --start-services, launch missing services once before any test runs
+    
+    Under pytest-xdist this runs only on the controller, before the workers start.
+    """
+    if config.getoption('--start-services') and not hasattr(config, 'workerinput'):
+        config.stash[_STARTED_SERVICES] = _start_services()
+
+def pytest_unconfigure(config):
+    """Stop the services launched by pytest_configure"""
+    processes = config.stash.get(_STARTED_SERVICES, [])
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()